@@ -0,0 +1,43 @@
+"""
+Run the solution for one day of Advent of Code 2020 eg.
+
+    python -m aoc day25 [arguments for the day...]
+
+Only the selected day's module is imported so none of the other days' inputs
+or dependencies are loaded. Any arguments after the day are passed on to it.
+"""
+import argparse
+import importlib
+from os import path
+import sys
+
+HERE, _ = path.split(path.realpath(__file__))
+# the module in each day's directory with a `main(argv)` entry point...
+DAYS = {
+    "day1": "day1",
+    "day2": "day2",
+    "day3": "toboggan",
+    "day23": "crab",
+    "day24": "tiling",
+    "day25": "encryption",
+}
+
+
+def load(day):
+    """Import the module for the day. Modules import their neighbours by name
+    so the day's directory goes on the path first."""
+    sys.path.insert(0, path.join(HERE, day))
+    return importlib.import_module(DAYS[day])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("day", choices=DAYS)
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+    load(args.day).main(args.args)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,14 @@
 """
 1. Subtract each entry off the target value (2020) -> remainders
 2. Look through the entries for each remainder
+
+For any number of summands, `find_k_sum` sorts the entries and closes in on
+the target from both ends instead.
 """
+import collections
+import math
 from os import path
+import sys
 
 HERE, _ = path.split(path.realpath(__file__))
 EXAMPLE_INPUT = path.join(HERE, "input-example.txt")
@@ -14,6 +20,11 @@ def get_entries(filename):
     with open(filename, 'r') as file:
         return {int(line.strip()) for line in file}
 
+def get_entries_list(filename):
+    """Get the entries from the file in order, keeping any repeats"""
+    with open(filename, 'r') as file:
+        return [int(line.strip()) for line in file]
+
 def subtract(value, entries):
     """Subtract the entry off the value and return another set of remainders"""
     return {(value - entry) for entry in entries}
@@ -28,23 +39,135 @@ def get_summands(target, entries):
     assert len(summands) % 2 == 0, "Should be an even number of summands"
     return summands
 
+def find_k_sum(entries, target, k):
+    """Find every combination of k entries that adds up to the target.
+
+    Each combination is a tuple in ascending order and is only reported once.
+    An entry that appears more than once may be used as many times as it
+    appears. Pairs are found in O(n log n) by sorting and walking in from both
+    ends, and each extra summand multiplies that by n.
+    """
+    values = sorted(entries)
+    return list(_k_sum(values, 0, target, k))
+
+def _k_sum(values, start, target, k):
+    """Generate the combinations of k of values[start:] adding up to target"""
+    if k == 2:
+        yield from _two_sum(values, start, target)
+        return
+    if k < 2:
+        if k == 1 and target in values[start:]:
+            yield (target,)
+        if k == 0 and target == 0:
+            yield ()
+        return
+    for i in range(start, len(values) - k + 1):
+        value = values[i]
+        if i > start and value == values[i - 1]:
+            # already tried everything starting with this value...
+            continue
+        if value * k > target:
+            # everything from here on is too big...
+            break
+        if value + values[-1] * (k - 1) < target:
+            # too small even with the biggest values...
+            continue
+        for rest in _k_sum(values, i + 1, target - value, k - 1):
+            yield (value,) + rest
+
+def _two_sum(values, start, target):
+    """Generate the pairs from values[start:] adding up to target"""
+    low, high = start, len(values) - 1
+    while low < high:
+        total = values[low] + values[high]
+        if total < target:
+            low += 1
+        elif total > target:
+            high -= 1
+        else:
+            yield values[low], values[high]
+            # step past any repeats of this pair...
+            summand = values[low]
+            while low < high and values[low] == summand:
+                low += 1
+            high -= 1
+
+class EntryIndex:
+    """The entries indexed once so that many targets can be queried without
+    doing any setup each time.
+
+    Pairs are found with a single pass over the sorted entries checking a hash
+    of them. Triples use a table of the sums of every pair of entries, which is
+    only built the first time a triple is asked for.
+    """
+
+    def __init__(self, entries):
+        self._values = sorted(entries)
+        self._counts = collections.Counter(self._values)
+        self._pair_sums = None
+
+    @classmethod
+    def from_file(cls, filename):
+        return cls(get_entries_list(filename))
+
+    @property
+    def pair_sums(self):
+        """Map of each sum to the (i, j) indices of the pairs of sorted entries
+        that add up to it, where i < j"""
+        if self._pair_sums is None:
+            values = self._values
+            pair_sums = collections.defaultdict(list)
+            for j, value in enumerate(values):
+                for i in range(j):
+                    pair_sums[values[i] + value].append((i, j))
+            self._pair_sums = dict(pair_sums)
+        return self._pair_sums
+
+    def pair(self, target):
+        """Get the pair of entries with the smallest first summand that adds up
+        to the target, or None"""
+        counts = self._counts
+        for value in self._values:
+            complement = target - value
+            if complement < value:
+                break
+            if complement in counts and \
+                    (complement != value or counts[value] > 1):
+                return value, complement
+        return None
+
+    def triple(self, target):
+        """Get a triple of entries adding up to the target in ascending order,
+        or None"""
+        values = self._values
+        pair_sums = self.pair_sums
+        for k, value in enumerate(values):
+            # the pair must come before this entry so each entry is only used
+            # once...
+            for i, j in pair_sums.get(target - value, ()):
+                if j < k:
+                    return values[i], values[j], value
+        return None
+
+    def query_many(self, targets, k=2):
+        """Get the pair (k=2) or triple (k=3) for each of the targets"""
+        query = {2: self.pair, 3: self.triple}[k]
+        return [query(target) for target in targets]
+
 def get_solution_part1(entries):
-    summand1, summand2 = get_summands(TARGET, entries)
-    return summand1 * summand2
+    # only the first pair is needed so stop as soon as it's found...
+    summands = next(_k_sum(sorted(entries), 0, TARGET, 2), None)
+    return math.prod(summands) if summands else None
 
 def get_solution_part2(entries):
-    remainders = subtract(TARGET, entries)
-    for remainder in remainders:
-        # Can the remainder be made from any of the entries?
-        summands = get_summands(target=remainder, entries=entries)
-        if summands:
-            summand1, summand2 = summands
-            summand3 = (TARGET - remainder)
-            return summand1 * summand2 * summand3
-    return None
-
-
-assert(get_solution_part1(get_entries(EXAMPLE_INPUT)) == 514579)
-assert(get_solution_part2(get_entries(EXAMPLE_INPUT)) == 241861950)
-print(get_solution_part1(get_entries(DAY1_INPUT)))
-print(get_solution_part2(get_entries(DAY1_INPUT)))
+    summands = next(_k_sum(sorted(entries), 0, TARGET, 3), None)
+    return math.prod(summands) if summands else None
+
+def main(argv=None):
+    filename = argv[0] if argv else DAY1_INPUT
+    entries = get_entries_list(filename)
+    print(get_solution_part1(entries))
+    print(get_solution_part2(entries))
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
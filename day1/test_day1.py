@@ -0,0 +1,71 @@
+import itertools
+import math
+import tempfile
+import unittest
+
+import day1
+
+class Day1TestGroup(unittest.TestCase):
+    def setUp(self):
+        self.entries = day1.get_entries(day1.EXAMPLE_INPUT)
+
+    def test_example_part_1(self):
+        self.assertEqual(514579, day1.get_solution_part1(self.entries))
+
+    def test_example_part_2(self):
+        self.assertEqual(241861950, day1.get_solution_part2(self.entries))
+
+    def test_repeated_entries_are_kept_from_file(self):
+        with tempfile.NamedTemporaryFile('w', suffix=".txt") as file:
+            file.write("1010\n1010\n5\n")
+            file.flush()
+            entries = day1.get_entries_list(file.name)
+        self.assertEqual([1010, 1010, 5], entries)
+        self.assertEqual(1020100, day1.get_solution_part1(entries))
+        self.assertIsNone(day1.get_solution_part2(entries))
+
+    def test_pairs_include_repeated_entries(self):
+        self.assertEqual(
+            [(1000, 1020), (1010, 1010)],
+            day1.find_k_sum([1010, 1000, 1010, 1020, 1020], 2020, 2))
+        self.assertEqual([], day1.find_k_sum([1010, 1000], 2020, 2))
+
+    def test_every_combination_is_found_once(self):
+        entries = [-1, 0, 1, 2, -1, -4]
+        self.assertEqual(
+            [(-1, -1, 2), (-1, 0, 1)], day1.find_k_sum(entries, 0, 3))
+        self.assertEqual(
+            [(-4, 0, 1, 2), (-1, -1, 0, 1)], day1.find_k_sum(entries, -1, 4))
+
+    def test_matches_brute_force(self):
+        entries = [3, 7, 1, 9, 4, 4, 6, 2, 8, 3, 5]
+        for k in range(1, 5):
+            for target in range(0, 30):
+                expected = sorted({
+                    tuple(sorted(combination))
+                    for combination in itertools.combinations(entries, k)
+                    if sum(combination) == target
+                })
+                self.assertEqual(
+                    expected,
+                    day1.find_k_sum(entries, target, k),
+                    msg=f"k={k}, target={target}")
+
+    def test_index_answers_example(self):
+        index = day1.EntryIndex(self.entries)
+        self.assertEqual(514579, math.prod(index.pair(day1.TARGET)))
+        self.assertEqual(241861950, math.prod(index.triple(day1.TARGET)))
+
+    def test_index_matches_k_sum_engine(self):
+        entries = [3, 7, 1, 9, 4, 4, 6, 2, 8, 3, 5]
+        index = day1.EntryIndex(entries)
+        targets = range(0, 30)
+        for k, results in [
+                (2, index.query_many(targets)),
+                (3, index.query_many(targets, k=3))]:
+            for target, result in zip(targets, results):
+                expected = day1.find_k_sum(entries, target, k)
+                if expected:
+                    self.assertIn(result, expected, msg=f"k={k}, {target}")
+                else:
+                    self.assertIsNone(result, msg=f"k={k}, {target}")
@@ -0,0 +1,44 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import day1
+
+if numpy is not None:
+    import vectorised
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class VectorisedTestGroup(unittest.TestCase):
+    def setUp(self):
+        self.entries = vectorised.get_entries_array(day1.EXAMPLE_INPUT)
+
+    def test_entries_loaded_as_int64(self):
+        self.assertEqual(numpy.int64, self.entries.dtype)
+        self.assertEqual(
+            sorted(day1.get_entries(day1.EXAMPLE_INPUT)),
+            sorted(self.entries.tolist()))
+
+    def test_example_part_1(self):
+        self.assertEqual(514579, vectorised.get_solution_part1(self.entries))
+
+    def test_example_part_2(self):
+        self.assertEqual(
+            241861950, vectorised.get_solution_part2(self.entries))
+
+    def test_matches_k_sum_engine(self):
+        entries = numpy.array([3, 7, 1, 9, 4, 4, 6, 2, 8, 3, 5, -2])
+        for target in range(-5, 30):
+            self.assertEqual(
+                day1.find_k_sum(entries.tolist(), target, 2),
+                [tuple(pair) for pair in
+                 vectorised.find_pairs(entries, target).tolist()],
+                msg=f"pairs for {target}")
+            self.assertEqual(
+                day1.find_k_sum(entries.tolist(), target, 3),
+                [tuple(triple) for triple in
+                 vectorised.find_triples(entries, target).tolist()],
+                msg=f"triples for {target}")
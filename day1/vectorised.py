@@ -0,0 +1,66 @@
+"""
+Day 1 with the entries held in a NumPy int64 array (8 bytes each) rather than
+a set of Python ints. The summands are found with `np.searchsorted` against
+the sorted unique entries.
+"""
+import numpy as np
+
+import day1
+
+
+def get_entries_array(filename):
+    """Get the entries from the file as an int64 array in one bulk read"""
+    return np.fromfile(filename, dtype=np.int64, sep=" ")
+
+
+def find_pairs(entries, target):
+    """Find every pair of entries that adds up to the target as an (n, 2) array
+    with each pair in ascending order. An entry that appears twice can pair
+    with itself."""
+    values, counts = np.unique(entries, return_counts=True)
+    return _pairs(values, counts, target)
+
+
+def find_triples(entries, target):
+    """Find every triple of entries that adds up to the target as an (n, 3)
+    array with each triple in ascending order"""
+    values, counts = np.unique(entries, return_counts=True)
+    triples = []
+    for i, value in enumerate(values):
+        if value * 3 > target:
+            # everything from here on is too big...
+            break
+        # the other two summands can't be smaller than this one and this one
+        # can only be used again if it appears more than once...
+        rest_counts = counts[i:].copy()
+        rest_counts[0] -= 1
+        pairs = _pairs(values[i:], rest_counts, target - value)
+        if len(pairs):
+            triples.append(np.column_stack(
+                [np.full(len(pairs), value, dtype=values.dtype), pairs]))
+    if not triples:
+        return np.empty((0, 3), dtype=np.int64)
+    return np.concatenate(triples)
+
+
+def _pairs(values, counts, target):
+    """Find the pairs from the sorted unique values adding up to the target,
+    where each value may be used as many times as its count"""
+    if not len(values):
+        return np.empty((0, 2), dtype=np.int64)
+    complements = target - values
+    index = np.minimum(np.searchsorted(values, complements), len(values) - 1)
+    found = (values[index] == complements) & (counts[index] > 0) & (counts > 0)
+    keep = found & (
+        (values < complements) | ((values == complements) & (counts >= 2)))
+    return np.column_stack([values[keep], complements[keep]])
+
+
+def get_solution_part1(entries):
+    pairs = find_pairs(entries, day1.TARGET)
+    return int(np.prod(pairs[0])) if len(pairs) else None
+
+
+def get_solution_part2(entries):
+    triples = find_triples(entries, day1.TARGET)
+    return int(np.prod(triples[0])) if len(triples) else None
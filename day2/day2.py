@@ -1,12 +1,26 @@
 import collections
+from concurrent import futures
+import io
+import mmap
+import os
 from os import path
 import re
+import sys
 
 HERE, _ = path.split(path.realpath(__file__))
 EXAMPLE_INPUT = path.join(HERE, "input-example.txt")
 EXAMPLE_INPUT2 = path.join(HERE, "input-day2-first-20.txt")
 REAL_INPUT = path.join(HERE, "input-day2.txt")
 REGEX = re.compile("(\d+)-(\d+) (\w): (\w+)")
+# the same as REGEX but matched a line at a time over a whole file of bytes.
+# It also takes the rest of the line and its ending so that the next match
+# starts on the next line...
+BULK_REGEX = re.compile(rb"(\d+)-(\d+) (\w): (\w+)[^\r\n]*(?:\r\n|\r|\n)?")
+# bytes patterns only know ASCII so other text is left to REGEX...
+NON_ASCII_REGEX = re.compile(rb"[^\x00-\x7f]")
+
+ValidPasswordCounts = collections.namedtuple(
+    "ValidPasswordCounts", ["part1", "part2"])
 
 ParsedPasswordEntry = collections.namedtuple(
     "ParsedEntry",
@@ -63,36 +77,121 @@ def is_valid_part2(entry):
     pos1 = entry.param1 - 1
     pos2 = entry.param2 - 1
 
-    result = (entry.password[pos1] == entry.token) \
+    return (entry.password[pos1] == entry.token) \
         and (entry.password[pos2] != entry.token)
-    print(f"{entry} -> {result}")
-    return result
 
 def count_valid_passwords(filename, validator):
     valid_entries = filter(validator, map(parse_line, get_lines(filename)))
     return sum(1 for entry in valid_entries)
 
-assert (count_valid_passwords(EXAMPLE_INPUT2, is_valid_part2) == 7), count_valid_passwords(EXAMPLE_INPUT2, is_valid_part2)
-
-
-# # check the parser/validators...
-# # PART1
-# assert (is_valid_part1(parse_line("1-8 n: dpwpmhknmnlglhjtrbpx")))
-# assert (not is_valid_part1(parse_line("2-6 b: ab")))
-# assert (count_valid_passwords(EXAMPLE_INPUT, is_valid_part1) == 2)
-# # PART2
-# assert (is_valid_part2(parse_line("1-3 a: abcde")))
-# assert (not is_valid_part2(parse_line("1-3 b: cdefg")))
-# assert (not is_valid_part2(parse_line("2-9 c: ccccccccc")))
-# assert (not is_valid_part2(parse_line("2-9 c: cbccccccc")))
-# assert (count_valid_passwords(EXAMPLE_INPUT, is_valid_part2) == 1)
-# assert (count_valid_passwords(EXAMPLE_INPUT2, is_valid_part2) == 7), count_valid_passwords(EXAMPLE_INPUT2, is_valid_part2)
-# # show the solution...
-# print(
-#     "PART1: valid passwords -> "
-#     f"{count_valid_passwords(REAL_INPUT, is_valid_part1)}"
-# )
-print(
-    "PART2: valid passwords -> "
-    f"{count_valid_passwords(REAL_INPUT, is_valid_part2)}"
-)
+def count_valid_passwords_bulk(filename):
+    """Count the passwords that are valid under each of the policies in a single
+    pass over the memory mapped file.
+
+    This applies the same rules as `is_valid_part1` and `is_valid_part2` but
+    works on the raw bytes without making an entry for each line. Just like
+    `parse_line`, a line that can't be parsed raises an AssertionError. Files
+    that aren't plain ASCII are counted from the parsed entries instead so
+    that passwords are matched and indexed by character rather than by byte.
+    """
+    part1 = 0
+    part2 = 0
+    if not path.getsize(filename):
+        # can't map an empty file...
+        return ValidPasswordCounts(part1, part2)
+    with open(filename, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if NON_ASCII_REGEX.search(buffer):
+            return _count_valid_passwords_parsed(filename)
+        position = 0
+        for match in BULK_REGEX.finditer(buffer):
+            # each match must start where the last one ended or the line in
+            # between couldn't be parsed...
+            if match.start() != position:
+                _raise_unparsed(buffer, position)
+            position = match.end()
+            param1, param2, token, password = match.groups()
+            param1 = int(param1)
+            param2 = int(param2)
+            if param1 <= password.count(token) <= param2:
+                part1 += 1
+            # note that positions are 1 indexed and indexing bytes gives ints
+            token = token[0]
+            if password[param1 - 1] == token and password[param2 - 1] != token:
+                part2 += 1
+        if position != len(buffer):
+            _raise_unparsed(buffer, position)
+    return ValidPasswordCounts(part1, part2)
+
+def _raise_unparsed(buffer, position):
+    """Raise the same error as `parse_line` for the line at the position"""
+    end = buffer.find(b"\n", position) + 1 or len(buffer)
+    line = buffer[position:end].decode()
+    raise AssertionError(f"Could not parse '{line}'")
+
+def _count_valid_passwords_parsed(filename):
+    """Count the passwords that are valid under each of the policies from the
+    parsed entries in a single pass over the file"""
+    part1 = 0
+    part2 = 0
+    for entry in map(parse_line, get_lines(filename)):
+        part1 += is_valid_part1(entry)
+        part2 += is_valid_part2(entry)
+    return ValidPasswordCounts(part1, part2)
+
+def get_chunks(filename, n_chunks):
+    """Split the file into about n_chunks (start, stop) byte ranges that each
+    end just after a newline so no line is split between two of them"""
+    size = path.getsize(filename)
+    boundaries = [0]
+    with open(filename, 'rb') as file:
+        for i in range(1, n_chunks):
+            file.seek(max(size * i // n_chunks, boundaries[-1]))
+            # move on to the start of the next line...
+            file.readline()
+            boundaries.append(file.tell())
+    boundaries.append(size)
+    return [
+        (start, stop)
+        for start, stop in zip(boundaries, boundaries[1:])
+        if stop > start
+    ]
+
+def count_valid_passwords_in_chunk(filename, start, stop, validator):
+    """Count the valid passwords in the lines between the byte offsets"""
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        chunk = file.read(stop - start)
+    # decode the lines just as opening the file in text mode would...
+    lines = io.TextIOWrapper(io.BytesIO(chunk))
+    valid_entries = filter(validator, map(parse_line, lines))
+    return sum(1 for entry in valid_entries)
+
+def count_valid_passwords_parallel(
+        filename, validator, workers=None, chunks_per_worker=4):
+    """Count the valid passwords like `count_valid_passwords` but with the
+    file split into chunks that are counted in a pool of processes. The
+    validator is sent to the workers so it must be picklable eg. a module
+    level function."""
+    workers = workers or os.cpu_count()
+    chunks = get_chunks(filename, workers * chunks_per_worker)
+    with futures.ProcessPoolExecutor(workers) as executor:
+        counts = [
+            executor.submit(
+                count_valid_passwords_in_chunk,
+                filename,
+                start,
+                stop,
+                validator)
+            for start, stop in chunks
+        ]
+        return sum(count.result() for count in counts)
+
+def main(argv=None):
+    filename = argv[0] if argv else REAL_INPUT
+    counts = count_valid_passwords_bulk(filename)
+    print(f"PART1: valid passwords -> {counts.part1}")
+    print(f"PART2: valid passwords -> {counts.part2}")
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+import day2
+from day2 import (
+    count_valid_passwords,
+    is_valid_part1,
+    is_valid_part2,
+    parse_line,
+)
+
+class Day2TestGroup(unittest.TestCase):
+
+    def test_part_1_validator(self):
+        self.assertTrue(
+            is_valid_part1(parse_line("1-8 n: dpwpmhknmnlglhjtrbpx")))
+        self.assertFalse(is_valid_part1(parse_line("2-6 b: ab")))
+
+    def test_example_part_1(self):
+        self.assertEqual(
+            2, count_valid_passwords(day2.EXAMPLE_INPUT, is_valid_part1))
+
+    def test_part_2_validator(self):
+        self.assertTrue(is_valid_part2(parse_line("1-3 a: abcde")))
+        self.assertFalse(is_valid_part2(parse_line("1-3 b: cdefg")))
+        self.assertFalse(is_valid_part2(parse_line("2-9 c: ccccccccc")))
+        self.assertFalse(is_valid_part2(parse_line("2-9 c: cbccccccc")))
+
+    def test_example_part_2(self):
+        self.assertEqual(
+            1, count_valid_passwords(day2.EXAMPLE_INPUT, is_valid_part2))
+        self.assertEqual(
+            7, count_valid_passwords(day2.EXAMPLE_INPUT2, is_valid_part2))
+
+    def test_bulk_counts_match_validators(self):
+        for filename in [day2.EXAMPLE_INPUT, day2.EXAMPLE_INPUT2]:
+            self.assertEqual(
+                (count_valid_passwords(filename, is_valid_part1),
+                 count_valid_passwords(filename, is_valid_part2)),
+                day2.count_valid_passwords_bulk(filename))
+
+    def test_bulk_counts_example(self):
+        counts = day2.count_valid_passwords_bulk(day2.EXAMPLE_INPUT)
+        self.assertEqual(2, counts.part1)
+        self.assertEqual(1, counts.part2)
+
+    def write_input(self, text):
+        """Write the text to a temporary input file and return its name"""
+        file = tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', suffix=".txt", delete=False)
+        self.addCleanup(os.remove, file.name)
+        with file:
+            file.write(text)
+        return file.name
+
+    def test_unparsable_line_is_an_error_for_every_engine(self):
+        filename = self.write_input("1-3 a: abcde\nGARBAGE\n2-9 c: ccccccccc\n")
+        with self.assertRaises(AssertionError):
+            count_valid_passwords(filename, is_valid_part1)
+        with self.assertRaises(AssertionError):
+            day2.count_valid_passwords_bulk(filename)
+        with self.assertRaises(AssertionError):
+            day2.count_valid_passwords_parallel(
+                filename, is_valid_part1, workers=1)
+
+    def test_bulk_counts_non_ascii_passwords_by_character(self):
+        filename = self.write_input(
+            "1-2 é: éa\n2-3 a: éaé\n1-3 ß: aßß\n1-3 a: abcde\n")
+        self.assertEqual(
+            (count_valid_passwords(filename, is_valid_part1),
+             count_valid_passwords(filename, is_valid_part2)),
+            day2.count_valid_passwords_bulk(filename))
+
+    def test_chunks_end_on_newlines(self):
+        with open(day2.EXAMPLE_INPUT2, 'rb') as file:
+            contents = file.read()
+        chunks = day2.get_chunks(day2.EXAMPLE_INPUT2, 7)
+        self.assertEqual(0, chunks[0][0])
+        self.assertEqual(len(contents), chunks[-1][1])
+        for (_, stop), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(stop, start)
+            self.assertEqual(b"\n", contents[stop - 1:stop])
+
+    def test_parallel_counts_match_serial(self):
+        for validator in [is_valid_part1, is_valid_part2]:
+            self.assertEqual(
+                count_valid_passwords(day2.EXAMPLE_INPUT2, validator),
+                day2.count_valid_passwords_parallel(
+                    day2.EXAMPLE_INPUT2, validator, workers=2))
@@ -0,0 +1,223 @@
+from array import array
+import itertools
+import struct
+
+# a label of zero is never a cup so it marks an empty slot in the tables...
+_EMPTY = 0
+# origin, length, the number of entries in each table and the bounds...
+_HEADER = struct.Struct('<IIIII')
+
+
+class CircularArrayList:
+    """A circular doubly linked list of integer labels held in flat arrays.
+
+    This is a drop-in alternative to `CircularLinkedList` for the cup game.
+    Rather than a node object per element, the successor and predecessor of
+    each label are stored in `array('I')` tables indexed by the label itself so
+    a million cups take a few MB. Labels must be positive integers.
+    """
+
+    def __init__(self, data: iter=None):
+        self._next = array('I')
+        self._previous = array('I')
+        self._length = 0
+        # remember the initial element that was inserted. It will serve as a
+        # useful reference point for when the circle is converted to a list.
+        self._origin = None
+        # the lowest and highest labels are found on demand and remembered
+        # until the membership changes...
+        self._bounds = None
+        self._contiguous = False
+        if data is not None:
+            self._link(array('I', data))
+
+    @classmethod
+    def padded(cls, data: iter, padding: range):
+        """Make the list from the data followed by the padding range"""
+        return cls(itertools.chain(data, padding))
+
+    @classmethod
+    def from_buffer(cls, buffer, offset: int=0):
+        """Make the list from a buffer laid out by `write` without copying the
+        tables. Use a writable buffer such as a copy-on-write `mmap` so that
+        the list can still be modified. The list must run to the end of the
+        buffer. A buffer that doesn't match its header raises ValueError."""
+        origin, length, capacity, lowest, highest = \
+            _HEADER.unpack_from(buffer, offset)
+        start = offset + _HEADER.size
+        # a truncated or padded buffer can't be trusted...
+        if memoryview(buffer).nbytes != start + 8 * capacity:
+            raise ValueError("buffer size doesn't match the tables")
+        if length and max(origin, lowest, highest) >= capacity:
+            raise ValueError("labels are out of range of the tables")
+        tables = memoryview(buffer)[start:start + 8 * capacity].cast('I')
+        circle = cls()
+        circle._next = tables[:capacity]
+        circle._previous = tables[capacity:]
+        circle._length = length
+        if length:
+            circle._origin = origin
+            circle._set_bounds(lowest, highest)
+        return circle
+
+    def __bool__(self):
+        return bool(self._length)
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, item):
+        return 0 < item < len(self._next) and self._next[item] != _EMPTY
+
+    def __iter__(self):
+        element = self._origin
+        for _ in range(len(self)):
+            yield element
+            element = self._next[element]
+
+    def __eq__(self, other):
+        # The lengths must match for equality...
+        if len(self) != len(other):
+            return False
+        if not self:
+            return True
+        # They may be in the same order but rotated so start both at the same
+        # element...
+        if self._origin not in other:
+            return False
+        return self.to_list() == other.to_list(location=self._origin)
+
+    def __repr__(self):
+        return '->'.join(str(data) for data in self)
+
+    @property
+    def bounds(self):
+        """The lowest and highest values in the list"""
+        if self._bounds is None:
+            self._find_bounds()
+        return self._bounds
+
+    @property
+    def is_contiguous(self):
+        """Whether every integer between the bounds is in the list"""
+        if self._bounds is None:
+            self._find_bounds()
+        return self._contiguous
+
+    def next(self, location):
+        """Get the next cup from the given location"""
+        return self._next[location]
+
+    def previous(self, location):
+        """Get the previous cup from the given location"""
+        return self._previous[location]
+
+    def move(self, dst, src, length):
+        """Move a portion of the list with the specified length from the src
+        location to the dst location"""
+        successor = self._next
+        predecessor = self._previous
+        # early return if there is nothing to do...
+        if successor[dst] == src:
+            return
+        # get the end of the chunk to be moved...
+        tail = src
+        for _ in range(length - 1):
+            tail = successor[tail]
+        # store some refs temporarily...
+        dst_next = successor[dst]
+        head_previous = predecessor[src]
+        tail_next = successor[tail]
+        # close the gap left by the chunk...
+        successor[head_previous] = tail_next
+        predecessor[tail_next] = head_previous
+        # insert the chunk...
+        successor[dst] = src
+        predecessor[src] = dst
+        successor[tail] = dst_next
+        predecessor[dst_next] = tail
+
+    def append(self, value):
+        """Append the value to the tail of the list. The value must be a
+        positive integer that is not already in the list."""
+        self._reserve(value)
+        if not self:
+            # first one edge case...element just points to itself...
+            self._next[value] = value
+            self._previous[value] = value
+            self._origin = value
+        else:
+            tail = self._previous[self._origin]
+            self._next[tail] = value
+            self._previous[value] = tail
+            self._next[value] = self._origin
+            self._previous[self._origin] = value
+        self._length += 1
+        self._bounds = None
+
+    def to_list(self, location=None, length=None):
+        """Convert to a python list starting at the location specified if one is
+        provided. Only a sublist may be returned if length is supplied."""
+        element = location if location else self._origin
+        count = length if length else len(self)
+        successor = self._next
+        result = []
+        for _ in range(count):
+            result.append(element)
+            element = successor[element]
+        return result
+
+    def write(self, file):
+        """Write the list to a binary file as a header followed by the raw
+        successor and predecessor tables"""
+        lowest, highest = self.bounds if self else (0, 0)
+        file.write(_HEADER.pack(
+            self._origin or 0, self._length, len(self._next), lowest, highest))
+        file.write(self._next.tobytes())
+        file.write(self._previous.tobytes())
+
+    def clear(self):
+        """Remove all elements"""
+        self._next = array('I')
+        self._previous = array('I')
+        self._length = 0
+        self._origin = None
+        self._bounds = None
+
+    def _reserve(self, label):
+        """Grow the tables so that they can be indexed by the label"""
+        shortfall = label + 1 - len(self._next)
+        if shortfall > 0:
+            if not isinstance(self._next, array):
+                # tables viewed from a buffer can't grow so take a copy...
+                self._next = array('I', self._next)
+                self._previous = array('I', self._previous)
+            self._next.extend(array('I', bytes(4 * shortfall)))
+            self._previous.extend(array('I', bytes(4 * shortfall)))
+
+    def _find_bounds(self):
+        """Remember the lowest and highest labels and whether every label
+        between them is present"""
+        self._set_bounds(min(self), max(self))
+
+    def _set_bounds(self, lowest, highest):
+        self._bounds = (lowest, highest)
+        self._contiguous = highest - lowest + 1 == self._length
+
+    def _link(self, labels):
+        """Link the labels into a circle in the order given in a single pass"""
+        if not labels:
+            return
+        self._reserve(max(labels))
+        self._origin = labels[0]
+        # close the circle by returning to the first label...
+        labels.append(labels[0])
+        successor = self._next
+        predecessor = self._previous
+        previous = labels[0]
+        for label in labels[1:]:
+            successor[previous] = label
+            predecessor[label] = previous
+            previous = label
+        self._length = len(labels) - 1
+        self._set_bounds(min(labels), max(labels))
@@ -0,0 +1,121 @@
+"""
+Play many cup games at once, spread over a pool of processes.
+
+Each line of a jobs file holds the cup labels, the number of moves and
+optionally the total number of cups, separated by whitespace. Games without
+extra cups are scored as in part 1 and games with extra cups as in part 2.
+Results are printed one per line in the same order as the jobs.
+"""
+import argparse
+import collections
+from concurrent import futures
+import os
+
+import crab
+
+# each cup needs a successor and a predecessor entry in a CircularArrayList...
+BYTES_PER_CUP = 8
+# ...plus the interpreter itself for each worker...
+BYTES_PER_WORKER = int(30E6)
+
+Job = collections.namedtuple("Job", ["labels", "moves", "n_cups"])
+
+
+def read_jobs(filename: str) -> list:
+    """Read the jobs from the file, ignoring blank lines. A job that can't be
+    played raises ValueError naming its line."""
+    jobs = []
+    with open(filename, 'r') as file:
+        for line_number, line in enumerate(file, start=1):
+            fields = line.split()
+            if not fields:
+                continue
+            if len(fields) not in (2, 3):
+                raise ValueError(
+                    f"{filename}:{line_number}: expected labels, moves and "
+                    f"optionally the number of cups")
+            labels, moves, *n_cups = fields
+            job = Job(
+                labels,
+                int(moves),
+                int(n_cups[0]) if n_cups else len(labels))
+            if job.n_cups < len(job.labels):
+                raise ValueError(
+                    f"{filename}:{line_number}: {job.n_cups} cups is fewer "
+                    f"than the {len(job.labels)} labels")
+            jobs.append(job)
+    return jobs
+
+
+def estimate_memory(job: Job) -> int:
+    """Roughly how many bytes a worker needs to play the job"""
+    return BYTES_PER_WORKER + BYTES_PER_CUP * job.n_cups
+
+
+def solve(job: Job) -> str:
+    """Play the game for a single job"""
+    if job.n_cups == len(job.labels):
+        return crab.solution_part_1(labels=job.labels, moves=job.moves)
+    return crab.solution_part_2(
+        labels=job.labels, moves=job.moves, total=job.n_cups)
+
+
+def solve_many(
+        jobs: list,
+        workers: int=None,
+        memory_budget: int=None) -> list:
+    """Play all of the jobs in a process pool and return the results in the
+    same order as the jobs.
+
+    A job is only started while the estimated memory of the jobs in flight
+    stays within the budget. A job that is bigger than the whole budget is
+    still played, but on its own.
+    """
+    workers = workers or os.cpu_count()
+    results = [None] * len(jobs)
+    pending = collections.deque(enumerate(jobs))
+    in_flight = {}
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        while pending or in_flight:
+            # start as many jobs as the budget allows...
+            while pending and len(in_flight) < workers:
+                index, job = pending[0]
+                committed = sum(estimate for _, estimate in in_flight.values())
+                estimate = estimate_memory(job)
+                if in_flight and memory_budget is not None \
+                        and committed + estimate > memory_budget:
+                    break
+                pending.popleft()
+                future = executor.submit(solve, job)
+                in_flight[future] = (index, estimate)
+            # ...then wait for something to finish to make room...
+            done, _ = futures.wait(
+                in_flight, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                index, _ = in_flight.pop(future)
+                results[index] = future.result()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("jobs", help="file with one job per line")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of processes (default: one per core)")
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        default=None,
+        help="maximum estimated memory for the jobs in flight in MB")
+    args = parser.parse_args()
+    budget = int(args.memory_budget * 1E6) if args.memory_budget else None
+    results = solve_many(read_jobs(args.jobs), args.workers, budget)
+    for result in results:
+        print(result)
+
+
+if __name__ == '__main__':
+    main()
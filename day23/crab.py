@@ -1,26 +1,70 @@
+import argparse
+import collections
 import itertools
-import sys
+import mmap
+import os
+import resource
+import struct
+import time
 
+from arraylist import CircularArrayList
 from linkedlist import CircularLinkedList
 
 N_CUPS = int(1E6)
 N_MOVES = int(1E7)
+CHECKPOINT_INTERVAL = int(1E6)
+PROGRESS_INTERVAL = int(1E5)
+# magic, moves completed, current cup, total cups and the length of the
+# labels...
+_CHECKPOINT_HEADER = struct.Struct('<4sQIII')
+_CHECKPOINT_MAGIC = b'CUPS'
 
-def make_cups(labels: str) -> list:
+Progress = collections.namedtuple(
+    "Progress",
+    [
+        "moves_done",
+        "moves",
+        "rate", # moves per second
+        "eta", # seconds
+        "peak_memory", # bytes
+    ]
+)
+
+def make_cups(labels: str, circle: type=CircularLinkedList) -> list:
     """Make the cups as a list from the string of cup labels"""
-    return CircularLinkedList(int(label) for label in labels)
+    return circle(int(label) for label in labels)
 
-def make_cups_part_2(labels: str, total: int=N_CUPS) -> list:
+def make_cups_part_2(
+        labels: str,
+        total: int=N_CUPS,
+        circle: type=CircularArrayList) -> list:
     """Make the cups from the string of cup labels as described in part 1.
     Additional cups are then added until the total is reached"""
     part1 = [int(label) for label in labels]
     max_label = max(part1) + (total - len(part1))
-    # FIXME: Very inefficient to create two lists. We should just have one long
-    #        generator.
-    padding = list(range(max(part1) + 1, max_label + 1))
-    part2 = part1 + padding
-    assert len(part2) == total
-    return CircularLinkedList(part2)
+    padding = range(max(part1) + 1, max_label + 1)
+    assert len(part1) + len(padding) == total
+    return circle.padded(part1, padding)
+
+def get_destination(current: int, picked_up: list, cups) -> int:
+    """Get the label of the destination cup for the current cup.
+
+    Labels below the lowest cup wrap around to the highest using the bounds
+    that the circle keeps so this never has to scan the cups. When the labels
+    are contiguous every candidate is known to be in the circle so only the
+    picked up cups need to be skipped.
+    """
+    lowest, highest = cups.bounds
+    target = current - 1 if current > lowest else highest
+    if cups.is_contiguous:
+        while target in picked_up:
+            target = target - 1 if target > lowest else highest
+        return target
+    for _ in range(len(cups)):
+        if target not in picked_up and target in cups:
+            return target
+        target = target - 1 if target > lowest else highest
+    raise AssertionError("Stuck!")
 
 def move_cups(current: int, cups: CircularLinkedList) -> int: # return the new current cup
     """
@@ -45,45 +89,169 @@ def move_cups(current: int, cups: CircularLinkedList) -> int: # return the new c
     adjacent = cups.next(current)
     picked_up = cups.to_list(location=adjacent, length=3)
     # find the destination cup...
-    target = current - 1
-    counter = 0
-    while (target in picked_up) or (target not in cups):
-        target -= 1
-        counter += 1
-        if target < 0:
-            target = max(cups)
-        if counter > len(cups):
-            raise AssertionError("Stuck!")
+    target = get_destination(current, picked_up, cups)
     # move the cups...
     cups.move(dst=target, src=adjacent, length=3)
     # return the new current cup...
     return cups.next(current)
 
+def play(current: int, cups, moves: int) -> int:
+    """Play a number of moves without any checks in between and return the
+    new current cup"""
+    move = move_cups
+    for _ in range(moves):
+        current = move(current, cups)
+    return current
+
 def get_order(cups: CircularLinkedList) -> str:
     """The order of labels from cup `1`"""
     rotated = cups.to_list(location=1)
     return ''.join(str(label) for label in rotated[1:])
 
-def solution_part_1(labels: str, moves: int) -> str:
-    cups = make_cups(labels)
+def save_checkpoint(
+        filename: str,
+        labels: str,
+        cups: CircularArrayList,
+        current: int,
+        moves_done: int):
+    """Save the state of a game so that it can be resumed later.
+
+    The file is written alongside and then renamed into place so that an
+    existing checkpoint is never left half written if we're killed.
+    """
+    if not isinstance(cups, CircularArrayList):
+        raise TypeError("Checkpoints are only supported for CircularArrayList")
+    encoded = labels.encode()
+    # keep the tables word aligned...
+    padding = -(_CHECKPOINT_HEADER.size + len(encoded)) % 4
+    partial = filename + '.partial'
+    with open(partial, 'wb') as file:
+        file.write(_CHECKPOINT_HEADER.pack(
+            _CHECKPOINT_MAGIC, moves_done, current, len(cups), len(encoded)))
+        file.write(encoded + bytes(padding))
+        cups.write(file)
+    os.replace(partial, filename)
+
+def load_checkpoint(filename: str) -> tuple:
+    """Load the labels, cups, current cup, number of moves completed and total
+    number of cups from a checkpoint. The file is memory mapped copy-on-write
+    so loading is cheap and the checkpoint itself is left untouched as the
+    game continues."""
+    with open(filename, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    try:
+        magic, moves_done, current, total, n_labels = \
+            _CHECKPOINT_HEADER.unpack_from(buffer)
+    except struct.error:
+        raise ValueError(f"'{filename}' is corrupt")
+    if magic != _CHECKPOINT_MAGIC:
+        raise ValueError(f"'{filename}' is not a checkpoint")
+    start = _CHECKPOINT_HEADER.size
+    labels = buffer[start:start + n_labels].decode()
+    offset = start + n_labels + (-(start + n_labels) % 4)
+    try:
+        cups = CircularArrayList.from_buffer(buffer, offset)
+    except (ValueError, struct.error):
+        raise ValueError(f"'{filename}' is corrupt")
+    if len(cups) != total or current not in cups:
+        raise ValueError(f"'{filename}' is corrupt")
+    return labels, cups, current, moves_done, total
+
+def get_peak_memory() -> int:
+    """The peak resident memory of this process in bytes"""
+    # linux reports this in kB...
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def print_progress(progress: Progress):
+    """A progress hook that prints a line for each report"""
+    print(
+        f"{(progress.moves_done / progress.moves * 100):3.0f}% complete... "
+        f"{progress.rate:,.0f} moves/s, "
+        f"ETA {progress.eta:.0f}s, "
+        f"peak memory {progress.peak_memory / 1E6:.0f} MB")
+
+def solution_part_1(
+        labels: str,
+        moves: int,
+        circle: type=CircularLinkedList) -> str:
+    cups = make_cups(labels, circle)
     current_cup = int(labels[0])
     for _ in range(moves):
         current_cup = move_cups(current_cup, cups)
     return get_order(cups)
 
-def solution_part_2(labels: str, moves: int=N_MOVES) -> int:
-    cups = make_cups_part_2(labels)
-    current_cup = int(labels[0])
-    for i in range(moves):
-        if not i % (moves / 100):
-            print(f"{(i / moves * 100):3.0f}% complete...")
-        current_cup = move_cups(current_cup, cups)
+def solution_part_2(
+        labels: str,
+        moves: int=N_MOVES,
+        total: int=N_CUPS,
+        circle: type=CircularArrayList,
+        checkpoint: str=None,
+        checkpoint_interval: int=CHECKPOINT_INTERVAL,
+        progress: callable=None,
+        progress_interval: int=PROGRESS_INTERVAL) -> int:
+    """Play the game with `total` cups. If a checkpoint file is given, the
+    game is saved to it every `checkpoint_interval` moves and resumed from it
+    if it already exists. If a progress hook is given, it is called with a
+    `Progress` report every `progress_interval` moves.
+
+    A checkpoint is only resumed for the same labels and total that it was
+    saved for and no more moves than were asked for may have been played.
+    """
+    if checkpoint is not None and os.path.exists(checkpoint):
+        saved_labels, cups, current_cup, moves_done, saved_total = \
+            load_checkpoint(checkpoint)
+        if saved_labels != labels:
+            raise ValueError(
+                f"checkpoint is for a game starting '{saved_labels}'")
+        if saved_total != total:
+            raise ValueError(
+                f"checkpoint is for a game with {saved_total} cups")
+        if moves_done > moves:
+            raise ValueError(
+                f"checkpoint has already played {moves_done} moves")
+    else:
+        if checkpoint is not None and \
+                not issubclass(circle, CircularArrayList):
+            raise TypeError(
+                "Checkpoints are only supported for CircularArrayList")
+        cups = make_cups_part_2(labels, total, circle)
+        current_cup = int(labels[0])
+        moves_done = 0
+    # the moves in between checkpoints and progress reports are played without
+    # any checks...
+    intervals = []
+    if checkpoint is not None:
+        intervals.append(checkpoint_interval)
+    if progress is not None:
+        intervals.append(progress_interval)
+    started_at, started_from = time.perf_counter(), moves_done
+    while moves_done < moves:
+        chunk_end = min(
+            [moves] + [(moves_done // i + 1) * i for i in intervals])
+        current_cup = play(current_cup, cups, chunk_end - moves_done)
+        moves_done = chunk_end
+        if checkpoint is not None and not moves_done % checkpoint_interval:
+            save_checkpoint(checkpoint, labels, cups, current_cup, moves_done)
+        if progress is not None and not moves_done % progress_interval:
+            elapsed = time.perf_counter() - started_at
+            rate = (moves_done - started_from) / elapsed if elapsed else 0.
+            eta = (moves - moves_done) / rate if rate else 0.
+            progress(Progress(
+                moves_done, moves, rate, eta, get_peak_memory()))
+    if checkpoint is not None and moves_done % checkpoint_interval:
+        save_checkpoint(checkpoint, labels, cups, current_cup, moves_done)
     next_cup = cups.next(location=1)
     next_next_cup = cups.next(location=next_cup)
     return str(next_cup * next_next_cup)
 
 # The actual solutions...
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Day 23: Crab Cups")
+    parser.add_argument("labels", help="the cup labels in order eg. 389125467")
+    args = parser.parse_args(argv)
+    print(solution_part_1(labels=args.labels, moves=100))
+    print(solution_part_2(
+        labels=args.labels, moves=N_MOVES, progress=print_progress))
+
 if __name__ == '__main__':
-    problem_input = sys.argv[1]
-    print(solution_part_1(labels=problem_input, moves=100))
-    print(solution_part_2(labels=problem_input, moves=int(1E7)))
+    main()
@@ -0,0 +1,134 @@
+class LazyCircularList:
+    """A circular doubly linked list of integer labels followed by a run of
+    padding labels that are only materialised once they are touched.
+
+    Until a padding label is moved, its neighbours follow the rule that the
+    successor of `k` is `k + 1` and the predecessor is `k - 1`. Only labels
+    whose links differ from that rule are stored so memory grows with the
+    number of labels that have been moved rather than with the padding.
+    """
+
+    def __init__(self, data: iter=None, padding: range=range(0)):
+        assert padding.step == 1, "padding must be a contiguous range"
+        self._next = {}
+        self._previous = {}
+        self._padding = padding
+        labels = list(data) if data is not None else []
+        self._length = len(labels) + len(padding)
+        self._origin = None
+        self._bounds = None
+        self._contiguous = False
+        if not self:
+            return
+        # link the explicit labels, then join them to either end of the
+        # padding. Everything in between the ends is implicit...
+        ends = labels + ([padding[0], padding[-1]] if padding else [])
+        self._origin = ends[0]
+        for previous, label in zip(labels, labels[1:]):
+            self._link(previous, label)
+        if padding:
+            if labels:
+                self._link(labels[-1], padding[0])
+            self._link(padding[-1], self._origin)
+        else:
+            self._link(labels[-1], self._origin)
+        self._set_bounds(min(ends), max(ends))
+
+    @classmethod
+    def padded(cls, data: iter, padding: range):
+        """Make the list from the data followed by the padding range"""
+        return cls(data, padding)
+
+    def __bool__(self):
+        return bool(self._length)
+
+    def __len__(self):
+        return self._length
+
+    def __contains__(self, item):
+        return item in self._next or item in self._padding
+
+    def __iter__(self):
+        element = self._origin
+        for _ in range(len(self)):
+            yield element
+            element = self.next(element)
+
+    def __eq__(self, other):
+        # The lengths must match for equality...
+        if len(self) != len(other):
+            return False
+        if not self:
+            return True
+        # They may be in the same order but rotated so start both at the same
+        # element...
+        if self._origin not in other:
+            return False
+        return self.to_list() == other.to_list(location=self._origin)
+
+    def __repr__(self):
+        return '->'.join(str(data) for data in self)
+
+    @property
+    def bounds(self):
+        """The lowest and highest values in the list"""
+        return self._bounds
+
+    @property
+    def is_contiguous(self):
+        """Whether every integer between the bounds is in the list"""
+        return self._contiguous
+
+    @property
+    def materialised(self):
+        """The number of labels whose links are stored explicitly"""
+        return len(self._next.keys() | self._previous.keys())
+
+    def next(self, location):
+        """Get the next cup from the given location"""
+        return self._next.get(location, location + 1)
+
+    def previous(self, location):
+        """Get the previous cup from the given location"""
+        return self._previous.get(location, location - 1)
+
+    def move(self, dst, src, length):
+        """Move a portion of the list with the specified length from the src
+        location to the dst location"""
+        successor = self._next
+        # early return if there is nothing to do...
+        if successor.get(dst, dst + 1) == src:
+            return
+        # get the end of the chunk to be moved...
+        tail = src
+        for _ in range(length - 1):
+            tail = successor.get(tail, tail + 1)
+        # store some refs temporarily...
+        dst_next = successor.get(dst, dst + 1)
+        head_previous = self._previous.get(src, src - 1)
+        tail_next = successor.get(tail, tail + 1)
+        # close the gap left by the chunk and insert it. Every link that
+        # changes is written explicitly in both directions...
+        self._link(head_previous, tail_next)
+        self._link(dst, src)
+        self._link(tail, dst_next)
+
+    def to_list(self, location=None, length=None):
+        """Convert to a python list starting at the location specified if one is
+        provided. Only a sublist may be returned if length is supplied."""
+        element = location if location else self._origin
+        count = length if length else len(self)
+        successor = self._next
+        result = []
+        for _ in range(count):
+            result.append(element)
+            element = successor.get(element, element + 1)
+        return result
+
+    def _link(self, previous, label):
+        self._next[previous] = label
+        self._previous[label] = previous
+
+    def _set_bounds(self, lowest, highest):
+        self._bounds = (lowest, highest)
+        self._contiguous = highest - lowest + 1 == self._length
@@ -1,5 +1,9 @@
+import gc
+import itertools
+
 
 class Node:
+    __slots__ = ('_next', '_previous', '_data')
 
     def __init__(self, data):
         self._next = None
@@ -44,9 +48,27 @@ class CircularLinkedList:
         # remember the initial element that was inserted. It will serve as a
         # useful reference point for when the circle is converted to a list.
         self._origin = None
+        # the lowest and highest labels are found on demand and remembered
+        # until the membership changes...
+        self._bounds = None
+        self._contiguous = False
         if data is not None:
-            for value in data:
-                self.append(value)
+            self.extend(data)
+
+    @classmethod
+    def from_iterable(cls, data: iter):
+        """Make the list from the data, linking all of the nodes in one pass"""
+        return cls(data)
+
+    @classmethod
+    def from_range(cls, start: int, stop: int):
+        """Make the list from the integers in the range [start, stop)"""
+        return cls(range(start, stop))
+
+    @classmethod
+    def padded(cls, data: iter, padding: range):
+        """Make the list from the data followed by the padding range"""
+        return cls(itertools.chain(data, padding))
 
     def __bool__(self):
         return bool(self._nodes)
@@ -81,6 +103,20 @@ class CircularLinkedList:
     def __repr__(self):
         return '->'.join(str(data) for data in self)
 
+    @property
+    def bounds(self):
+        """The lowest and highest values in the list"""
+        if self._bounds is None:
+            self._find_bounds()
+        return self._bounds
+
+    @property
+    def is_contiguous(self):
+        """Whether every integer between the bounds is in the list"""
+        if self._bounds is None:
+            self._find_bounds()
+        return self._contiguous
+
     def next(self, location):
         """Get the next cup from the given location"""
         return self._get_node(location, 1).data
@@ -125,6 +161,56 @@ class CircularLinkedList:
             node.next = self._origin
         # 2. store hash for fast lookup later...
         self._nodes[node.data] = node
+        self._bounds = None
+
+    def extend(self, data: iter):
+        """Append all of the values to the tail of the linked list.
+
+        The nodes are chained together directly as they are made and the circle
+        is only closed once at the end which is much cheaper than appending
+        values one at a time.
+        """
+        # every new node is held by the lookup table so the collector has
+        # nothing to find. Pause it rather than let it rescan the growing
+        # list over and over...
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            self._extend(data)
+        finally:
+            if collecting:
+                gc.enable()
+
+    def _extend(self, data: iter):
+        nodes = self._nodes
+        first = self._origin
+        # make the nodes without calling __init__ for each one. Every slot is
+        # filled in as they're linked...
+        new_node = Node.__new__
+        iterator = iter(data)
+        if first is not None:
+            tail = first._previous
+        else:
+            # the first value starts the list...
+            for value in iterator:
+                first = tail = new_node(Node)
+                first._data = value
+                nodes[value] = first
+                break
+            else:
+                return
+        for value in iterator:
+            node = new_node(Node)
+            node._data = value
+            node._previous = tail
+            tail._next = node
+            nodes[value] = node
+            tail = node
+        # close the circle...
+        tail._next = first
+        first._previous = tail
+        self._origin = first
+        self._bounds = None
 
     def to_list(self, location=None, length=None):
         """Convert to a python list starting at the location specified if one is
@@ -134,21 +220,30 @@ class CircularLinkedList:
         element = start_at
         result = []
         for _ in range(count):
-            result.append(element.data)
-            element = element.next
+            result.append(element._data)
+            element = element._next
         return result
 
     def clear(self):
         """Remove all elements"""
         self._nodes = {}
-        self._initial = None
-        self._last = None
+        self._origin = None
+        self._bounds = None
 
     def _get_node(self, location, offset):
         """Get node given by the location plus offset"""
         node = self._nodes[location]
-        if offset == 0:
-            return node
         if offset > 0:
-            return self._get_node(node.next.data, offset - 1)
-        return self._get_node(node.previous.data, offset + 1)
+            for _ in range(offset):
+                node = node._next
+        else:
+            for _ in range(-offset):
+                node = node._previous
+        return node
+
+    def _find_bounds(self):
+        """Remember the lowest and highest values and whether every integer
+        between them is present"""
+        lowest, highest = min(self), max(self)
+        self._bounds = (lowest, highest)
+        self._contiguous = highest - lowest + 1 == len(self)
@@ -0,0 +1,110 @@
+import io
+import unittest
+
+from arraylist import CircularArrayList
+from linkedlist import CircularLinkedList
+
+class ArrayListTestGroup(unittest.TestCase):
+    EXPECTED = [3, 8, 9, 1, 2, 5, 4, 6, 7]
+
+    def setUp(self):
+        self.my_list = CircularArrayList(self.EXPECTED)
+
+    def test_ordering_respected_on_conversion_to_list(self):
+        self.assertEqual(
+            self.EXPECTED,
+            self.my_list.to_list())
+        self.assertEqual(len(self.EXPECTED), len(self.my_list))
+
+    def test_sub_list_can_be_read(self):
+        self.assertEqual(
+            [1, 2, 5],
+            self.my_list.to_list(location=1, length=3))
+
+    def test_can_convert_to_list_starting_at_any_element(self):
+        self.assertEqual(
+            [1, 2, 5, 4, 6, 7, 3, 8, 9],
+            self.my_list.to_list(location=1))
+
+    def test_elements_appended_list_grows(self):
+        self.my_list.append(20)
+        self.assertEqual(
+            [3, 8, 9, 1, 2, 5, 4, 6, 7, 20],
+            self.my_list.to_list())
+        self.assertEqual(10, len(self.my_list))
+        self.assertFalse(15 in self.my_list)
+
+    def test_move_chunk_within_list_ordering_should_match(self):
+        self.my_list.move(dst=2, src=8, length=3)
+        self.assertEqual(
+            CircularArrayList([3, 2, 8, 9, 1, 5, 4, 6, 7]),
+            self.my_list)
+        self.my_list.move(dst=7, src=8, length=3)
+        self.assertEqual(
+            CircularArrayList([3, 2, 5, 4, 6, 7, 8, 9, 1]),
+            self.my_list)
+        self.my_list.move(dst=3, src=4, length=3)
+        self.assertEqual(
+            CircularArrayList([7, 2, 5, 8, 9, 1, 3, 4, 6]),
+            self.my_list)
+        self.my_list.move(dst=7, src=9, length=3)
+        self.assertEqual(
+            CircularArrayList([3, 2, 5, 8, 4, 6, 7, 9, 1]),
+            self.my_list)
+        self.assertEqual(9, len(self.my_list))
+        self.assertEqual(4, self.my_list.previous(location=6))
+
+    def test_move_chunk_already_in_position_nothing_changes(self):
+        self.my_list.move(dst=7, src=3, length=2)
+        self.assertEqual(
+            [3, 8, 9, 1, 2, 5, 4, 6, 7],
+            self.my_list.to_list())
+
+    def test_clearing_list_removes_all_elements(self):
+        self.my_list.clear()
+        self.assertFalse(self.my_list)
+        self.assertEqual(0, len(self.my_list))
+
+    def test_element_is_member_should_return_true(self):
+        self.assertTrue(9 in self.my_list)
+
+    def test_element_is_not_member_should_return_false(self):
+        self.assertFalse(0 in self.my_list)
+        self.assertFalse(10 in self.my_list)
+
+    def test_calling_max_retrieves_largest_element(self):
+        self.assertEqual(9, max(self.my_list))
+
+    def test_bounds_track_lowest_and_highest_elements(self):
+        self.assertEqual((1, 9), self.my_list.bounds)
+        self.assertTrue(self.my_list.is_contiguous)
+        self.my_list.append(20)
+        self.assertEqual((1, 20), self.my_list.bounds)
+        self.assertFalse(self.my_list.is_contiguous)
+
+    def test_get_next_element_should_get_adjacent(self):
+        self.assertEqual(5, self.my_list.next(location=2))
+        self.assertEqual(1, self.my_list.previous(location=2))
+
+    def test_same_lists_compared_rotated_should_be_equal(self):
+        rotated = self.EXPECTED[-2:] + self.EXPECTED[:-2]
+        self.assertTrue(CircularArrayList(rotated) == self.my_list)
+
+    def test_different_compared_should_not_be_equal(self):
+        rotated = self.EXPECTED + [19, 20,]
+        self.assertFalse(CircularArrayList(rotated) == self.my_list)
+
+    def test_equal_to_linked_list_with_same_order(self):
+        self.assertTrue(self.my_list == CircularLinkedList(self.EXPECTED))
+
+    def test_written_list_can_be_viewed_from_buffer(self):
+        self.my_list.move(dst=2, src=8, length=3)
+        file = io.BytesIO()
+        self.my_list.write(file)
+        restored = CircularArrayList.from_buffer(bytearray(file.getvalue()))
+        self.assertEqual(self.my_list.to_list(), restored.to_list())
+        self.assertEqual((1, 9), restored.bounds)
+        restored.move(dst=7, src=8, length=3)
+        restored.append(20)
+        self.assertEqual(
+            [3, 2, 5, 4, 6, 7, 8, 9, 1, 20], restored.to_list())
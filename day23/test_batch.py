@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+import batch
+import crab
+
+class BatchTestGroup(unittest.TestCase):
+    JOBS = [
+        batch.Job("389125467", 10, 9),
+        batch.Job("389125467", 100, 9),
+        batch.Job("389125467", 1000, 100),
+        batch.Job("389125467", 500, 50),
+    ]
+
+    def test_jobs_are_read_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "jobs.txt")
+            with open(filename, 'w') as file:
+                file.write("389125467 10\n\n389125467 1000 100\n")
+            self.assertEqual(
+                [self.JOBS[0], self.JOBS[2]], batch.read_jobs(filename))
+
+    def test_jobs_with_too_few_cups_are_rejected(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "jobs.txt")
+            with open(filename, 'w') as file:
+                file.write("389125467 10\n\n389125467 1000 5\n")
+            with self.assertRaisesRegex(ValueError, ":3:"):
+                batch.read_jobs(filename)
+
+    def test_results_are_in_job_order(self):
+        expected = [batch.solve(job) for job in self.JOBS]
+        self.assertEqual('92658374', expected[0])
+        self.assertEqual('67384529', expected[1])
+        self.assertEqual(
+            crab.solution_part_2("389125467", moves=1000, total=100),
+            expected[2])
+        self.assertEqual(expected, batch.solve_many(self.JOBS, workers=2))
+
+    def test_jobs_over_memory_budget_are_still_played(self):
+        self.assertEqual(
+            [batch.solve(job) for job in self.JOBS],
+            batch.solve_many(self.JOBS, workers=4, memory_budget=1))
@@ -1,6 +1,12 @@
+import contextlib
+import io
+import os
+import tempfile
 import unittest
 
 import crab
+from arraylist import CircularArrayList
+from lazylist import LazyCircularList
 from linkedlist import CircularLinkedList
 
 class Part1TestGroup(unittest.TestCase):
@@ -43,6 +49,142 @@ class Part1TestGroup(unittest.TestCase):
             '67384529',
             crab.solution_part_1(labels=self.EXAMPLE_INPUT, moves=100))
 
+    def test_destination_skips_picked_up_cups(self):
+        self.assertEqual(
+            7, crab.get_destination(1, [9, 8, 2], self.cups))
+
+    def test_destination_wraps_below_lowest_label(self):
+        cups = crab.make_cups("3589")
+        self.assertEqual(9, crab.get_destination(3, [5, 8, 7], cups))
+        self.assertEqual(8, crab.get_destination(3, [9, 5, 7], cups))
+
+    def test_example_part_1_array_list(self):
+        self.assertEqual(
+            '67384529',
+            crab.solution_part_1(
+                labels=self.EXAMPLE_INPUT,
+                moves=100,
+                circle=CircularArrayList))
+
+    def test_lazy_padding_matches_array_list(self):
+        expected = crab.make_cups_part_2(self.EXAMPLE_INPUT, total=100)
+        actual = crab.make_cups_part_2(
+            self.EXAMPLE_INPUT, total=100, circle=LazyCircularList)
+        expected_cup = actual_cup = int(self.EXAMPLE_INPUT[0])
+        for _ in range(1000):
+            expected_cup = crab.move_cups(expected_cup, expected)
+            actual_cup = crab.move_cups(actual_cup, actual)
+        self.assertEqual(expected_cup, actual_cup)
+        self.assertEqual(expected, actual)
+
+    def test_checkpointed_game_resumes_where_it_left_off(self):
+        expected = crab.solution_part_2(labels=self.EXAMPLE_INPUT, moves=2000)
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, "cups.chk")
+            crab.solution_part_2(
+                labels=self.EXAMPLE_INPUT,
+                moves=1000,
+                checkpoint=checkpoint,
+                checkpoint_interval=300)
+            _, _, _, moves_done, _ = crab.load_checkpoint(checkpoint)
+            self.assertEqual(1000, moves_done)
+            actual = crab.solution_part_2(
+                labels=self.EXAMPLE_INPUT,
+                moves=2000,
+                checkpoint=checkpoint,
+                checkpoint_interval=300)
+        self.assertEqual(expected, actual)
+
+    def test_truncated_checkpoint_is_refused(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, "cups.chk")
+            crab.solution_part_2(
+                labels=self.EXAMPLE_INPUT,
+                moves=1000,
+                total=100,
+                checkpoint=checkpoint)
+            size = os.path.getsize(checkpoint)
+            # cut short mid label, on a label boundary and inside the header...
+            for length in [size - 3, size - 400, size - 800, 10]:
+                os.truncate(checkpoint, length)
+                with self.assertRaises(ValueError, msg=length):
+                    crab.load_checkpoint(checkpoint)
+                with self.assertRaises(ValueError, msg=length):
+                    crab.solution_part_2(
+                        labels=self.EXAMPLE_INPUT,
+                        moves=2000,
+                        total=100,
+                        checkpoint=checkpoint)
+
+    def test_checkpoint_for_a_different_game_is_refused(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, "cups.chk")
+            crab.solution_part_2(
+                labels=self.EXAMPLE_INPUT,
+                moves=1000,
+                total=100,
+                checkpoint=checkpoint)
+            with self.assertRaises(ValueError):
+                crab.solution_part_2(
+                    labels="389125476",
+                    moves=2000,
+                    total=100,
+                    checkpoint=checkpoint)
+            with self.assertRaises(ValueError):
+                crab.solution_part_2(
+                    labels=self.EXAMPLE_INPUT,
+                    moves=2000,
+                    total=5000,
+                    checkpoint=checkpoint)
+
+    def test_checkpoint_past_the_requested_moves_is_refused(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, "cups.chk")
+            crab.solution_part_2(
+                labels=self.EXAMPLE_INPUT,
+                moves=1000,
+                total=100,
+                checkpoint=checkpoint)
+            with self.assertRaises(ValueError):
+                crab.solution_part_2(
+                    labels=self.EXAMPLE_INPUT,
+                    moves=500,
+                    total=100,
+                    checkpoint=checkpoint)
+
+    def test_checkpoint_needs_array_list_before_playing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, "cups.chk")
+            for circle in [CircularLinkedList, LazyCircularList]:
+                with self.assertRaises(TypeError):
+                    crab.solution_part_2(
+                        labels=self.EXAMPLE_INPUT,
+                        moves=1,
+                        total=100,
+                        circle=circle,
+                        checkpoint=checkpoint)
+            self.assertFalse(os.path.exists(checkpoint))
+
+    def test_progress_hook_is_called_at_each_interval(self):
+        reports = []
+        crab.solution_part_2(
+            labels=self.EXAMPLE_INPUT,
+            moves=1000,
+            progress=reports.append,
+            progress_interval=250)
+        self.assertEqual(
+            [250, 500, 750, 1000],
+            [report.moves_done for report in reports])
+        self.assertEqual(0, reports[-1].eta)
+        self.assertTrue(all(report.rate > 0 for report in reports))
+        self.assertTrue(all(report.peak_memory > 0 for report in reports))
+
+    def test_main_without_labels_is_a_usage_error(self):
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit):
+                crab.main([])
+        self.assertIn("usage", stderr.getvalue())
+
     def test_example_part_2(self):
         self.assertEqual(
             '149245887792',
@@ -0,0 +1,56 @@
+import unittest
+
+from arraylist import CircularArrayList
+from lazylist import LazyCircularList
+
+class LazyListTestGroup(unittest.TestCase):
+    LABELS = [3, 8, 9, 1, 2, 5, 4, 6, 7]
+    PADDING = range(10, 21)
+
+    def setUp(self):
+        self.my_list = LazyCircularList(self.LABELS, self.PADDING)
+
+    def test_padding_follows_labels_in_order(self):
+        self.assertEqual(
+            self.LABELS + list(self.PADDING),
+            self.my_list.to_list())
+        self.assertEqual(20, len(self.my_list))
+
+    def test_padding_wraps_around_to_first_label(self):
+        self.assertEqual(3, self.my_list.next(location=20))
+        self.assertEqual(20, self.my_list.previous(location=3))
+        self.assertEqual(13, self.my_list.previous(location=14))
+
+    def test_padding_is_not_materialised_until_moved(self):
+        self.assertEqual(11, self.my_list.materialised)
+        self.my_list.move(dst=2, src=14, length=3)
+        self.assertEqual(
+            [2, 14, 15, 16, 5], self.my_list.to_list(location=2, length=5))
+        self.assertEqual(
+            [12, 13, 17, 18], self.my_list.to_list(location=12, length=4))
+        self.assertEqual(15, self.my_list.materialised)
+
+    def test_padding_is_member(self):
+        self.assertTrue(15 in self.my_list)
+        self.assertTrue(9 in self.my_list)
+        self.assertFalse(21 in self.my_list)
+        self.assertFalse(0 in self.my_list)
+
+    def test_bounds_span_labels_and_padding(self):
+        self.assertEqual((1, 20), self.my_list.bounds)
+        self.assertTrue(self.my_list.is_contiguous)
+
+    def test_moves_match_array_list(self):
+        expected = CircularArrayList.padded(self.LABELS, self.PADDING)
+        for dst, src in [(2, 8), (20, 12), (7, 3), (11, 4)]:
+            self.my_list.move(dst=dst, src=src, length=3)
+            expected.move(dst=dst, src=src, length=3)
+            self.assertEqual(expected, self.my_list)
+            self.assertEqual(
+                expected.to_list(location=3),
+                self.my_list.to_list(location=3))
+
+    def test_without_padding_behaves_as_plain_list(self):
+        my_list = LazyCircularList(self.LABELS)
+        self.assertEqual(self.LABELS, my_list.to_list())
+        self.assertEqual(3, my_list.next(location=7))
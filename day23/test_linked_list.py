@@ -79,6 +79,13 @@ class LinkedListTestGroup(unittest.TestCase):
     def test_calling_max_retrieves_largest_element(self):
         self.assertEqual(9, max(self.my_list))
 
+    def test_bounds_track_lowest_and_highest_elements(self):
+        self.assertEqual((1, 9), self.my_list.bounds)
+        self.assertTrue(self.my_list.is_contiguous)
+        self.my_list.append(20)
+        self.assertEqual((1, 20), self.my_list.bounds)
+        self.assertFalse(self.my_list.is_contiguous)
+
     def test_get_next_element_should_get_adjacent(self):
         self.assertEqual(5, self.my_list.next(location=2))
         self.assertEqual(1, self.my_list.previous(location=2))
@@ -90,3 +97,32 @@ class LinkedListTestGroup(unittest.TestCase):
     def test_different_compared_should_not_be_equal(self):
         rotated = self.EXPECTED + [19, 20,]
         self.assertFalse(CircularLinkedList(rotated) == self.my_list)
+
+    def test_extending_links_values_onto_tail(self):
+        self.my_list.extend([20, 21])
+        self.assertEqual(
+            [3, 8, 9, 1, 2, 5, 4, 6, 7, 20, 21],
+            self.my_list.to_list())
+        self.assertEqual(3, self.my_list.next(location=21))
+        self.assertEqual(21, self.my_list.previous(location=3))
+
+    def test_extending_cleared_list_starts_afresh(self):
+        self.my_list.clear()
+        self.my_list.extend([4, 5])
+        self.assertEqual([4, 5], self.my_list.to_list())
+        self.assertEqual(2, len(self.my_list))
+        self.assertEqual(4, self.my_list.next(location=5))
+
+    def test_built_from_range_matches_appended(self):
+        expected = CircularLinkedList()
+        for value in range(1, 10):
+            expected.append(value)
+        actual = CircularLinkedList.from_range(1, 10)
+        self.assertEqual(expected, actual)
+        self.assertEqual(list(range(1, 10)), actual.to_list())
+        self.assertEqual(9, actual.previous(location=1))
+
+    def test_large_offsets_do_not_recurse(self):
+        my_list = CircularLinkedList.from_iterable(range(1, 10001))
+        self.assertEqual(5001, my_list._get_node(1, 5000).data)
+        self.assertEqual(5001, my_list._get_node(1, -5000).data)
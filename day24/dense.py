@@ -0,0 +1,242 @@
+"""
+A floor held as a dense 2-D grid of tiles in the same basic offset layout as
+`tiling.Vector` ie. the tile at (row, col) is stored at
+grid[row - origin_row, col - origin_col] where 1 is black and 0 is white.
+"""
+from concurrent import futures
+from multiprocessing import shared_memory
+import os
+
+import numpy as np
+
+import tiling
+
+# the fewest rows/columns of padding added when live tiles reach an edge...
+_MIN_PADDING = 16
+# grids with fewer rows than this per worker aren't worth sharding...
+MIN_BAND_ROWS = 256
+
+
+def next_generation(grid):
+    """Apply the daily rules to the grid and return the new grid. Tiles off the
+    edge of the grid are taken to be white."""
+    # add up each of the six neighbours by shifting the grid...
+    counts = np.zeros_like(grid)
+    counts[:, :-1] += grid[:, 1:] # (0, 1)
+    counts[:, 1:] += grid[:, :-1] # (0, -1)
+    counts[:-1, :-1] += grid[1:, 1:] # (1, 1)
+    counts[:-1, :] += grid[1:, :] # (1, 0)
+    counts[1:, 1:] += grid[:-1, :-1] # (-1, -1)
+    counts[1:, :] += grid[:-1, :] # (-1, 0)
+    # a black tile stays black with one or two black neighbours and a
+    # white tile is flipped to black with exactly two...
+    return ((counts == 2) | ((grid == 1) & (counts == 1))).astype(np.uint8)
+
+
+class DenseFloor:
+    """A floor that applies the daily rules to the whole grid at once with
+    array operations. Well suited to floors where most tiles within the bounds
+    are black or change often.
+
+    The grid grows its padding only when black tiles reach an edge.
+    """
+
+    def __init__(self):
+        self._grid = np.zeros((1, 1), dtype=np.uint8)
+        self._origin = (0, 0)
+
+    @property
+    def black(self):
+        """The locations of the black tiles as (row, col) tuples"""
+        origin_row, origin_col = self._origin
+        rows, cols = np.nonzero(self._grid)
+        return {
+            (int(row) + origin_row, int(col) + origin_col)
+            for row, col in zip(rows, cols)
+        }
+
+    def flip_tile(self, location):
+        """Used at startup only when creating the floor the first time from
+        instructions."""
+        row, col = self._index(location.row, location.col)
+        self._grid[row, col] ^= 1
+
+    def count_black(self):
+        return int(self._grid.sum())
+
+    def update(self):
+        """Flip the tiles for today"""
+        self._ensure_margin()
+        self._grid = next_generation(self._grid)
+
+    def _index(self, row, col):
+        """Get the grid index of the location, growing the grid to fit"""
+        origin_row, origin_col = self._origin
+        height, width = self._grid.shape
+        self._grow(
+            top=max(0, origin_row - row),
+            bottom=max(0, row - origin_row - height + 1),
+            left=max(0, origin_col - col),
+            right=max(0, col - origin_col - width + 1))
+        origin_row, origin_col = self._origin
+        return row - origin_row, col - origin_col
+
+    def _ensure_margin(self):
+        """Make sure there's a border of white tiles all the way round so that
+        tiles flipped today fit in the grid"""
+        grid = self._grid
+        height, width = grid.shape
+        self._grow(
+            top=grid[0].any() * max(_MIN_PADDING, height // 4),
+            bottom=grid[-1].any() * max(_MIN_PADDING, height // 4),
+            left=grid[:, 0].any() * max(_MIN_PADDING, width // 4),
+            right=grid[:, -1].any() * max(_MIN_PADDING, width // 4))
+
+    def _grow(self, top, bottom, left, right):
+        if not (top or bottom or left or right):
+            return
+        self._grid = np.pad(self._grid, ((top, bottom), (left, right)))
+        origin_row, origin_col = self._origin
+        self._origin = (origin_row - top, origin_col - left)
+
+    @classmethod
+    def from_instructions(cls, instructions):
+        """Factory method to create from a list of directions. The grid is
+        built in one go from the target locations of all of the directions."""
+        floor = cls()
+        locations = np.array(
+            tiling.locate_all(instructions), dtype=np.int64).reshape(-1, 2)
+        if not len(locations):
+            return floor
+        lowest = locations.min(axis=0)
+        height, width = locations.max(axis=0) - lowest + 1
+        # a tile flipped an even number of times ends up white again...
+        flips = np.zeros((height, width), dtype=np.int64)
+        np.add.at(flips, tuple((locations - lowest).T), 1)
+        floor._grid = (flips % 2).astype(np.uint8)
+        floor._origin = (int(lowest[0]), int(lowest[1]))
+        return floor
+
+
+# the shared memory blocks a worker has mapped, by name. Only the most recent
+# is kept open...
+_worker_blocks = {}
+
+
+def _attach(name):
+    """Map the named shared memory block in this worker, reusing the mapping
+    from earlier bands of the same block"""
+    block = _worker_blocks.get(name)
+    if block is None:
+        for old in _worker_blocks.values():
+            old.close()
+        _worker_blocks.clear()
+        block = _worker_blocks[name] = shared_memory.SharedMemory(name=name)
+    return block
+
+
+def _update_band(name, shape, today, start, stop):
+    """Work out the next generation for rows [start, stop) of the grid in the
+    shared memory block. The block holds two grids; `today` is the index of
+    the current one and the other is overwritten with tomorrow's."""
+    block = _attach(name)
+    height, width = shape
+    grids = np.ndarray((2, height, width), dtype=np.uint8, buffer=block.buf)
+    # include a halo row either side so the band's edges see their
+    # neighbours...
+    halo_start, halo_stop = max(0, start - 1), min(height, stop + 1)
+    band = next_generation(grids[today, halo_start:halo_stop])
+    grids[1 - today, start:stop] = band[start - halo_start:stop - halo_start]
+
+
+class ShardedFloor(DenseFloor):
+    """A dense floor that splits each day's update into bands of rows and
+    works them out in a pool of processes.
+
+    The grid lives in a shared memory block that holds today's grid and
+    tomorrow's side by side. Each day the workers write tomorrow's grid from
+    today's and then the two swap over, so nothing is copied in the parent.
+    The block is only replaced when the grid grows. Each band is worked out
+    from its own rows plus one halo row either side, so the result is
+    identical to updating the whole grid at once. Grids too small to be worth
+    sharding are updated in this process.
+
+    Call `close` (or use as a context manager) to shut the pool down and free
+    the shared memory.
+    """
+
+    def __init__(self, workers=None):
+        super().__init__()
+        self._workers = workers or os.cpu_count()
+        self._executor = None
+        self._block = None
+        # views of the two grids in the block and which one is today's...
+        self._grids = None
+        self._today = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._release()
+
+    def update(self):
+        """Flip the tiles for today"""
+        self._ensure_margin()
+        height, width = self._grid.shape
+        n_bands = min(self._workers, height // MIN_BAND_ROWS)
+        if n_bands < 2:
+            self._grid = next_generation(self._grid)
+            return
+        if self._executor is None:
+            self._executor = futures.ProcessPoolExecutor(self._workers)
+        self._share()
+        edges = np.linspace(0, height, n_bands + 1, dtype=int)
+        jobs = [
+            self._executor.submit(
+                _update_band,
+                self._block.name,
+                (height, width),
+                self._today,
+                start,
+                stop)
+            for start, stop in zip(edges[:-1], edges[1:])
+        ]
+        for job in jobs:
+            job.result()
+        self._today = 1 - self._today
+        self._grid = self._grids[self._today]
+
+    def _share(self):
+        """Make sure today's grid is in the shared memory block. It already is
+        unless the grid has been replaced, eg. when it grows."""
+        if self._grids is not None and self._grid is self._grids[self._today]:
+            return
+        if self._grids is None or self._grids[0].shape != self._grid.shape:
+            self._release()
+            height, width = self._grid.shape
+            self._block = shared_memory.SharedMemory(
+                create=True, size=2 * height * width)
+            grids = np.ndarray(
+                (2, height, width), dtype=np.uint8, buffer=self._block.buf)
+            self._grids = (grids[0], grids[1])
+        self._today = 0
+        self._grids[0][...] = self._grid
+        self._grid = self._grids[0]
+
+    def _release(self):
+        """Free the shared memory block, keeping a private copy of the grid"""
+        if self._block is None:
+            return
+        if self._grids is not None and self._grid is self._grids[self._today]:
+            self._grid = self._grid.copy()
+        self._grids = None
+        self._block.close()
+        self._block.unlink()
+        self._block = None
@@ -0,0 +1,60 @@
+import unittest
+import unittest.mock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import test_tiling
+import tiling
+
+if numpy is not None:
+    import dense
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class DenseTilingTestGroup(test_tiling.TilingTestGroup):
+    FLOOR = dense.DenseFloor if numpy is not None else None
+
+    def test_matches_sparse_floor_while_growing(self):
+        floor = tiling.SparseFloor.from_instructions(test_tiling.EXAMPLE_INPUT)
+        for day in range(100):
+            floor.update()
+            self.floor.update()
+            self.assertEqual(floor.black, self.floor.black, msg=f"day {day}")
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class ShardedTilingTestGroup(test_tiling.TilingTestGroup):
+    FLOOR = dense.ShardedFloor if numpy is not None else None
+
+    def test_sharded_update_matches_serial_update(self):
+        expected = dense.DenseFloor.from_instructions(test_tiling.EXAMPLE_INPUT)
+        with unittest.mock.patch.object(dense, "MIN_BAND_ROWS", 4):
+            with dense.ShardedFloor(workers=3) as floor:
+                for location in expected.black:
+                    floor.flip_tile(tiling.Vector(*location))
+                for day in range(50):
+                    expected.update()
+                    floor.update()
+                    self.assertTrue(
+                        numpy.array_equal(expected._grid, floor._grid),
+                        msg=f"day {day}")
+                self.assertEqual(expected.black, floor.black)
+
+    def test_shared_grid_is_reused_until_it_grows(self):
+        with unittest.mock.patch.object(dense, "MIN_BAND_ROWS", 4):
+            with dense.ShardedFloor(workers=2) as floor:
+                for location in self.floor.black:
+                    floor.flip_tile(tiling.Vector(*location))
+                names = []
+                for _ in range(30):
+                    floor.update()
+                    names.append((floor._block.name, floor._grid.shape))
+                # a new block is only made when the grid changes shape...
+                self.assertEqual(
+                    len(set(shape for _, shape in names)),
+                    len(set(names)))
+                self.assertLess(len(set(names)), len(names))
+            self.assertIsNone(floor._block)
@@ -1,4 +1,7 @@
+import functools
+import gc
 import unittest
+import unittest.mock
 
 import tiling
 
@@ -6,8 +9,10 @@ EXAMPLE_INPUT = tiling.read_input(filename="example-input.txt")
 
 
 class TilingTestGroup(unittest.TestCase):
+    FLOOR = tiling.Floor
+
     def setUp(self):
-        self.floor = tiling.Floor.from_instructions(EXAMPLE_INPUT)
+        self.floor = self.FLOOR.from_instructions(EXAMPLE_INPUT)
 
     def test_nwwswee_flips_reference_tile_itself(self):
         self.assertEqual(
@@ -17,11 +22,36 @@ class TilingTestGroup(unittest.TestCase):
         self.assertEqual(
             tiling.Vector(1, 1), tiling.Vector.from_directions("esew"))
 
+    def test_long_directions_do_not_recurse(self):
+        self.assertEqual(
+            tiling.Vector(0, 5000), tiling.Vector.from_directions("e" * 5000))
+        self.assertEqual(
+            tiling.Vector(-2000, -2000),
+            tiling.Vector.from_directions("nwnew" * 1000))
+
+    def test_vectors_are_interned_only_while_used(self):
+        location = tiling.Vector(10 ** 6, 10 ** 6)
+        self.assertIs(location, tiling.Vector(10 ** 6, 10 ** 6))
+        self.assertEqual(6, len(location.adjacent))
+        del location
+        gc.collect()
+        self.assertNotIn((10 ** 6, 10 ** 6), tiling.Vector._interned)
+        self.assertNotIn((10 ** 6, 10 ** 6 + 1), tiling.Vector._interned)
+
+    def test_all_directions_located_in_one_go(self):
+        self.assertEqual(
+            [(0, 0), (1, 1), (1, 0)],
+            tiling.locate_all(["nwwswee", "esew", "sw"]))
+
+    def test_bad_directions_are_rejected(self):
+        with self.assertRaises(AssertionError):
+            tiling.locate("nse")
+
     def test_example_has_10_black_tiles(self):
         self.assertEqual(10, self.floor.count_black())
 
     def test_isolated_black_tile_is_flipped_back_to_white(self):
-        floor = tiling.Floor()
+        floor = self.FLOOR()
         floor.flip_tile(tiling.Vector(0,0))
         # should have a black tile...
         self.assertEqual(1, floor.count_black())
@@ -30,16 +60,15 @@ class TilingTestGroup(unittest.TestCase):
         self.assertFalse(floor.count_black())
 
     def test_three_adjacent_black_tiles_two_more_black_tiles_flipped_each_side(self):
-        floor = tiling.Floor()
+        floor = self.FLOOR()
         floor.flip_tile(tiling.Vector(0, 0))
         floor.flip_tile(tiling.Vector(0, 1))
         floor.flip_tile(tiling.Vector(0, -1))
-        self.assertEqual(3, floor.count_black())
         floor.update()
         self.assertEqual(7, floor.count_black())
 
     def test_white_tile_with_two_black_neighbours_flipped_to_black(self):
-        floor = tiling.Floor()
+        floor = self.FLOOR()
         # make the reference tile white with two black neighbours...
         floor.flip_tile(tiling.Vector(0, 1))
         floor.flip_tile(tiling.Vector(0, -1))
@@ -64,4 +93,77 @@ class TilingTestGroup(unittest.TestCase):
         ]
         for count in tile_count:
             self.floor.update()
-            self.assertEqual(count, self.floor.count_black())
\ No newline at end of file
+            self.assertEqual(count, self.floor.count_black())
+
+
+class IncrementalTilingTestGroup(TilingTestGroup):
+    FLOOR = functools.partial(tiling.Floor, incremental=True)
+
+    def setUp(self):
+        self.floor = tiling.Floor.from_instructions(
+            EXAMPLE_INPUT, incremental=True)
+
+    def test_matches_full_scan_each_day(self):
+        for _ in range(20):
+            self.floor.update(verify=True)
+        self.assertEqual(132, self.floor.count_black())
+
+    def test_settled_floor_only_examines_active_tiles(self):
+        # isolated tiles die straight away leaving plenty of white tiles
+        # behind, while three in a row keep cycling...
+        floor = tiling.Floor(incremental=True)
+        for i in range(1, 201):
+            floor.flip_tile(tiling.Vector(10 * i, 10 * i))
+        for col in range(3):
+            floor.flip_tile(tiling.Vector(0, col))
+        for _ in range(10):
+            floor.update(verify=True)
+        examined = [
+            tile
+            for tile in floor.tiles.values()
+            if tile._examined == floor._generation
+        ]
+        self.assertLess(len(examined), 100)
+        self.assertGreater(len(floor.tiles), 1000)
+
+
+class SparseTilingTestGroup(TilingTestGroup):
+    FLOOR = tiling.SparseFloor
+
+    def test_matches_floor_after_100_days(self):
+        floor = tiling.Floor.from_instructions(EXAMPLE_INPUT)
+        for _ in range(100):
+            floor.update()
+            self.floor.update()
+        self.assertEqual(2208, self.floor.count_black())
+        self.assertEqual(floor.count_black(), self.floor.count_black())
+
+    def test_advancing_example_matches_daily_updates(self):
+        self.floor.advance(20)
+        self.assertEqual(132, self.floor.count_black())
+
+    def test_advancing_oscillator_skips_whole_cycles(self):
+        # three tiles in a row settle into a cycle of three after two days...
+        expected = tiling.SparseFloor()
+        floor = tiling.SparseFloor()
+        for location in [(0, 0), (0, 1), (0, 2)]:
+            expected.flip_tile(tiling.Vector(*location))
+            floor.flip_tile(tiling.Vector(*location))
+        for _ in range(1001):
+            expected.update()
+        floor.advance(10 ** 12 + 1)
+        self.assertEqual(expected.black, floor.black)
+
+    def test_advancing_without_history_plays_every_day(self):
+        floor = tiling.SparseFloor.from_instructions(EXAMPLE_INPUT)
+        floor.advance(30, max_history=0)
+        self.floor.advance(30)
+        self.assertEqual(floor.black, self.floor.black)
+
+    def test_advancing_checks_shapes_when_hashes_collide(self):
+        floor = tiling.SparseFloor.from_instructions(EXAMPLE_INPUT)
+        with unittest.mock.patch.object(
+                tiling, "hash", lambda shape: 0, create=True):
+            floor.advance(30)
+        self.floor.advance(30)
+        self.assertEqual(floor.black, self.floor.black)
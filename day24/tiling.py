@@ -3,26 +3,84 @@ Represent the hexagonal grid with a basic offset layout ie. a tile has two
 indices to represent the row and column as per...
 https://gamedevelopment.tutsplus.com/tutorials/creating-hexagonal-minesweeper--cms-28655
 """
+import collections
+from os import path
+import re
+import sys
+import weakref
+
+HERE, _ = path.split(path.realpath(__file__))
+PUZZLE_INPUT = path.join(HERE, "puzzle-input.txt")
+_DIRECTIONS = re.compile("(?:[ns]?[ew])*")
+
 def read_input(filename: str):
     """Read the file and return a list of the lines"""
     with open(filename, 'r') as file:
         lines = file.readlines()
     return [line.strip() for line in lines]
 
+def locate(directions):
+    """Get the (row, col) of the target tile from the directions string.
+
+    The order of the steps doesn't matter so rather than walking the
+    directions one step at a time, the steps of each kind are counted. Every
+    'e' or 'w' ends a step so the single letter steps are those left over
+    once the two letter steps are taken away.
+    """
+    if not _DIRECTIONS.fullmatch(directions):
+        raise AssertionError(f"wtf is '{directions}'?!")
+    ne = directions.count('ne')
+    nw = directions.count('nw')
+    se = directions.count('se')
+    sw = directions.count('sw')
+    e = directions.count('e') - ne - se
+    w = directions.count('w') - nw - sw
+    return (se + sw - nw - ne), (e + se - w - nw)
+
+def locate_all(instructions):
+    """Get the (row, col) of the target tile for each line of directions"""
+    return [locate(directions) for directions in instructions]
+
+# (row, col) offsets to each of the six neighbours of a tile...
+_UNIT_OFFSETS = ((0, 1), (1, 1), (1, 0), (0, -1), (-1, -1), (-1, 0))
+
 class Vector:
-    """A hexagonal tile vector expressed in basic offset layout"""
-    def __init__(self, row, col):
-        self._row = row
-        self._col = col
+    """A hexagonal tile vector expressed in basic offset layout.
+
+    Vectors are interned so there is only ever one live instance per location.
+    The hash and the adjacent locations are worked out once per location and
+    remembered, so looking up a tile or its neighbours allocates nothing. Only
+    weak references are interned so vectors go once nothing else uses them.
+    """
+    __slots__ = ('_row', '_col', '_hash', '_adjacent', '__weakref__')
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, row, col):
+        key = (row, col)
+        try:
+            return cls._interned[key]
+        except KeyError:
+            pass
+        vector = super().__new__(cls)
+        vector._row = row
+        vector._col = col
+        vector._hash = hash(key)
+        vector._adjacent = None
+        cls._interned[key] = vector
+        return vector
+
+    def __getnewargs__(self):
+        return (self._row, self._col)
 
     def __add__(self, other):
         return Vector((self.row + other.row), (self.col + other.col))
 
     def __eq__(self, other):
-        return (self.row == other.row) and (self.col == other.col)
+        return (self is other) or \
+            ((self.row == other.row) and (self.col == other.col))
 
     def __hash__(self):
-        return hash((self.row, self.col,))
+        return self._hash
 
     @property
     def row(self):
@@ -32,54 +90,34 @@ class Vector:
     def col(self):
         return self._col
 
+    @property
+    def adjacent(self):
+        """The locations of the six neighbouring tiles"""
+        if self._adjacent is None:
+            row, col = self._row, self._col
+            self._adjacent = tuple(
+                Vector(row + d_row, col + d_col)
+                for d_row, d_col in _UNIT_OFFSETS)
+        return self._adjacent
+
     def __repr__(self):
-        return f"Vector({self.row}, {self.col}) " + super().__repr__()
+        return f"Vector({self.row}, {self.col})"
 
     @classmethod
     def from_directions(cls, directions):
         """Get the target tile vector from the directions string"""
-        # start at the reference tile
-        return cls._consume(cls(0, 0), directions)
-
-    @classmethod
-    def _consume(cls, vector, directions):
-        if not directions:
-            # no more directions to consume
-            return vector
-        if directions.startswith('e'):
-            vector += Vector(0, 1)
-            return cls._consume(vector, directions[1:])
-        if directions.startswith('se'):
-            vector += Vector(1, 1)
-            return cls._consume(vector, directions[2:])
-        if directions.startswith('sw'):
-            vector += Vector(1, 0)
-            return cls._consume(vector, directions[2:])
-        if directions.startswith('w'):
-            vector += Vector(0, -1)
-            return cls._consume(vector, directions[1:])
-        if directions.startswith('nw'):
-            vector += Vector(-1, -1)
-            return cls._consume(vector, directions[2:])
-        if directions.startswith('ne'):
-            vector += Vector(-1, 0)
-            return cls._consume(vector, directions[2:])
-        raise AssertionError(f"wtf is '{directions}'?!")
+        return cls(*locate(directions))
 
 
 class HexagonalTile:
-    _UNIT_VECTORS = [
-        Vector(0, 1),
-        Vector(1, 1),
-        Vector(1, 0),
-        Vector(0, -1),
-        Vector(-1, -1),
-        Vector(-1, 0),
-    ]
+    __slots__ = ('_location', '_floor', '_examined')
 
     def __init__(self, location, floor):
         self._location = location
         self._floor = floor
+        # the last generation in which an incremental floor examined this
+        # tile...
+        self._examined = -1
 
     def __eq__(self, other):
         return self.location == other.location
@@ -112,21 +150,29 @@ class HexagonalTile:
 
     @property
     def black_neighbours(self): # this is a horrible name!
-        return len(list(filter(lambda x: x.is_black, self.neighbours)))
+        tiles = self._floor.tiles
+        count = 0
+        for location in self._location.adjacent:
+            tile = tiles.get(location)
+            if tile is not None and tile.is_black:
+                count += 1
+        return count
 
     @property
     def adjacent_locations(self):
-        return ((self.location + vector) for vector in self._UNIT_VECTORS)
+        return self._location.adjacent
 
 
 class BlackTile(HexagonalTile):
+    __slots__ = ()
 
     @property
     def is_black(self):
         return True
 
     def update(self):
-        if self.black_neighbours == 0 or self.black_neighbours > 2:
+        black_neighbours = self.black_neighbours
+        if black_neighbours == 0 or black_neighbours > 2:
             self._floor.to_flip.append(self)
 
     def flip(self):
@@ -137,6 +183,7 @@ class BlackTile(HexagonalTile):
 
 
 class WhiteTile(HexagonalTile):
+    __slots__ = ()
 
     @property
     def is_black(self):
@@ -161,12 +208,24 @@ class WhiteTile(HexagonalTile):
 
 
 class Floor:
-    """A container that holds a lookup table of all the tiles."""
-    def __init__(self):
+    """A container that holds a lookup table of all the tiles.
+
+    In incremental mode, only the tiles that were flipped yesterday and their
+    neighbours are re-examined each day. Every other tile has the same
+    neighbours as yesterday, when it was not flipped, so it can't flip today
+    either. This only saves work once most of the floor has settled; while
+    the pattern is still growing nearly every tile is next to a flip anyway.
+    """
+    def __init__(self, incremental=False):
         # map of all tiles by location...
         self._tiles = {}
         # tiles that are due to be flipped...
         self._to_flip = []
+        self._incremental = incremental
+        # locations flipped since the last update and the number of the
+        # update so each tile around them is only examined once...
+        self._flipped = []
+        self._generation = 0
 
     @property
     def tiles(self):
@@ -185,33 +244,187 @@ class Floor:
         except KeyError:
             self.tiles[location] = WhiteTile(location, self)
             self.tiles[location].flip()
+        if self._incremental:
+            self._flipped.append(location)
 
     def count_black(self):
         return len(list(filter(lambda x: x.is_black, self.tiles.values())))
 
-    def update(self):
-        """Flip the tiles for today"""
-        # 1. update all tiles and see if they need to be flipped based on local
+    def update(self, verify=False):
+        """Flip the tiles for today. With verify, an incremental update is
+        checked against a scan of every tile."""
+        # 1. update the tiles and see if they need to be flipped based on local
         #    policies...
-        for tile in self.tiles.values():
-            tile.update()
+        if self._incremental:
+            self._update_flipped()
+        else:
+            for tile in self.tiles.values():
+                tile.update()
+        if verify and self._incremental:
+            self._verify()
         # 2. flip those that have been marked...
+        if self._incremental:
+            self._flipped = [tile.location for tile in self.to_flip]
         for tile in self.to_flip:
             tile.flip()
         self.to_flip.clear()
 
+    def _update_flipped(self):
+        """Update the tiles at and around the locations flipped yesterday,
+        each one only once"""
+        tiles = self._tiles
+        self._generation += 1
+        generation = self._generation
+        for location in self._flipped:
+            tile = tiles[location]
+            if tile._examined != generation:
+                tile._examined = generation
+                tile.update()
+            for adjacent in location.adjacent:
+                tile = tiles.get(adjacent)
+                # every neighbour of a flipped tile should be there already...
+                if tile is not None and tile._examined != generation:
+                    tile._examined = generation
+                    tile.update()
+
+    def _verify(self):
+        """Check that the tiles marked to flip are the same as a full scan"""
+        marked = {tile.location for tile in self.to_flip}
+        self.to_flip.clear()
+        for tile in self.tiles.values():
+            tile.update()
+        expected = {tile.location for tile in self.to_flip}
+        assert marked == expected, \
+            f"incremental update missed {expected - marked} " \
+            f"and wrongly flipped {marked - expected}"
+
+    @classmethod
+    def from_instructions(cls, instructions, incremental=False):
+        """Factory method to create from a list of directions"""
+        floor = cls(incremental)
+        for location in locate_all(instructions):
+            floor.flip_tile(Vector(*location))
+        return floor
+
+
+# how many past generations are remembered when looking for cycles...
+MAX_HISTORY = 1000
+
+class SparseFloor:
+    """A floor that only stores the locations of the black tiles as plain
+    (row, col) tuples. White tiles are implied by their absence.
+
+    Each day the black neighbours of every location are counted in a single
+    pass over the black tiles so no tile objects are needed at all.
+    """
+    _UNIT_OFFSETS = _UNIT_OFFSETS
+
+    def __init__(self):
+        self._black = set()
+
+    @property
+    def black(self):
+        return self._black
+
+    def flip_tile(self, location):
+        """Used at startup only when creating the floor the first time from
+        instructions."""
+        self._black ^= {(location.row, location.col)}
+
+    def count_black(self):
+        return len(self._black)
+
+    def update(self):
+        """Flip the tiles for today"""
+        black = self._black
+        counts = collections.Counter(
+            (row + d_row, col + d_col)
+            for row, col in black
+            for d_row, d_col in self._UNIT_OFFSETS)
+        # a black tile stays black with one or two black neighbours and a
+        # white tile is flipped to black with exactly two...
+        self._black = {
+            location
+            for location, count in counts.items()
+            if count == 2 or (count == 1 and location in black)
+        }
+
+    def advance(self, days, max_history=MAX_HISTORY):
+        """Flip the tiles for the given number of days.
+
+        Each generation is moved so that its lowest row and column are zero and
+        the hash of that shape is remembered along with the day and how far it
+        was moved. When a hash comes round again, the generation may have
+        repeated, possibly translated. One more period is played to check that
+        the shape really does repeat and then the remaining whole cycles are
+        skipped by translating the tiles rather than playing them out. Only
+        the most recent `max_history` hashes are remembered so cycles longer
+        than this are played out day by day.
+        """
+        seen = {}
+        day = 0
+        while day < days:
+            shape, offset = self._canonical()
+            key = hash(shape)
+            if key in seen:
+                first_day, _ = seen[key]
+                period = day - first_day
+                if period <= days - day:
+                    # hashes can collide so check the shape repeats...
+                    for _ in range(period):
+                        self.update()
+                    day += period
+                    repeat, repeat_offset = self._canonical()
+                    if repeat == shape:
+                        cycles = (days - day) // period
+                        self._translate(
+                            cycles * (repeat_offset[0] - offset[0]),
+                            cycles * (repeat_offset[1] - offset[1]))
+                        day += cycles * period
+                        break
+                    continue
+                del seen[key]
+            seen[key] = (day, offset)
+            if len(seen) > max_history:
+                # forget the oldest generation...
+                del seen[next(iter(seen))]
+            self.update()
+            day += 1
+        for _ in range(days - day):
+            self.update()
+
+    def _canonical(self):
+        """Get the black tiles moved to the origin and how far they moved"""
+        if not self._black:
+            return frozenset(), (0, 0)
+        lowest_row = min(row for row, _ in self._black)
+        lowest_col = min(col for _, col in self._black)
+        shape = frozenset(
+            (row - lowest_row, col - lowest_col) for row, col in self._black)
+        return shape, (lowest_row, lowest_col)
+
+    def _translate(self, d_row, d_col):
+        if d_row or d_col:
+            self._black = {
+                (row + d_row, col + d_col) for row, col in self._black}
+
     @classmethod
     def from_instructions(cls, instructions):
         """Factory method to create from a list of directions"""
         floor = cls()
-        for directions in instructions:
-            floor.flip_tile(Vector.from_directions(directions))
+        for location in locate_all(instructions):
+            floor.flip_tile(Vector(*location))
         return floor
 
 
-if __name__ == "__main__":
-    floor = Floor.from_instructions(read_input("puzzle-input.txt"))
+def main(argv=None):
+    filename = argv[0] if argv else PUZZLE_INPUT
+    floor = Floor.from_instructions(read_input(filename))
     print(f"PART1...{floor.count_black()}")
     for i in range(1, 101):
         floor.update()
         print(f"Day {i:3d}: {floor.count_black():4d}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,39 @@
+"""
+Compare the speed of the engines for the inverse transform.
+
+The brute force engine is far too slow for real keys so it is only timed on
+the small examples from the problem description.
+"""
+import sys
+import timeit
+
+import encryption
+
+EXAMPLE_KEYS = [encryption.CARD_PUBLIC_KEY, encryption.DOOR_PUBLIC_KEY]
+REPEATS = 5
+
+
+def benchmark(engine, keys, number):
+    """Get the best time in seconds to invert each of the keys once"""
+    timer = timeit.Timer(
+        lambda: [encryption.inverse_transform(key, engine) for key in keys])
+    return min(timer.repeat(repeat=REPEATS, number=number)) / number
+
+
+def main(argv=None):
+    filename = argv[0] if argv else encryption.PUZZLE_INPUT
+    puzzle_keys = list(encryption.read_keys(filename))
+    # make sure the tables are cached before timing anything...
+    encryption.get_giant_step_table()
+    print(f"{'engine':16s}{'examples':>12s}{'puzzle':>12s}")
+    for engine in encryption.ENGINES:
+        examples = benchmark(engine, EXAMPLE_KEYS, number=100)
+        if engine == "brute-force":
+            puzzle = "-"
+        else:
+            puzzle = f"{benchmark(engine, puzzle_keys, number=10) * 1E3:9.3f}ms"
+        print(f"{engine:16s}{examples * 1E3:10.3f}ms{puzzle:>12s}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
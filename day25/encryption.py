@@ -1,5 +1,17 @@
+from array import array
+import bisect
+import argparse
+import functools
+import itertools
 import math
+import mmap
+import multiprocessing
+import numbers
+import os
+import struct
 
+HERE, _ = os.path.split(os.path.realpath(__file__))
+PUZZLE_INPUT = os.path.join(HERE, "puzzle-input.txt")
 TRANSFORM_INTEGER = 20201227
 SUBJECT_INTEGER = 7
 CARD_PUBLIC_KEY = 5764801
@@ -7,6 +19,13 @@ CARD_LOOP_SIZE = 8
 DOOR_PUBLIC_KEY = 17807724
 DOOR_LOOP_SIZE = 11
 ENCRYPTION_KEY = 14897079
+CACHE_DIR = os.environ.get(
+    "AOC_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "aoc2020"))
+# magic, subject, modulus, step size and number of giant steps...
+_TABLE_HEADER = struct.Struct('<4sQQQQ')
+_TABLE_MAGIC = b'GSTB'
+# batches at least this big are transformed with numpy if it's available...
+NUMPY_BATCH_SIZE = 1000
 
 
 def read_keys(filename):
@@ -18,12 +37,58 @@ def read_keys(filename):
 
 def transform(loop_size: int, subject: int=SUBJECT_INTEGER) -> int:
     """Transform (exponentiation) operation described in the problem"""
+    # square and multiply rather than looping loop_size times...
+    return pow(subject, loop_size, TRANSFORM_INTEGER)
+
+
+def transform_loop(loop_size: int, subject: int=SUBJECT_INTEGER) -> int:
+    """Transform exactly as described in the problem. Kept as a reference."""
     result = 1
     for _ in range(loop_size):
         result = (result * subject) % TRANSFORM_INTEGER
     return result
 
 
+def transform_many(loop_sizes, subjects=SUBJECT_INTEGER) -> list:
+    """Transform each loop size with the matching subject, or with the same
+    subject for all of them if only one is given.
+
+    Large batches are done with vectorised square and multiply if NumPy is
+    available. Every value is reduced below TRANSFORM_INTEGER (< 2^25) so the
+    product of any two fits comfortably in a uint64 before it is reduced.
+    """
+    if isinstance(subjects, numbers.Integral):
+        subjects = itertools.repeat(subjects, len(loop_sizes))
+    if len(loop_sizes) < NUMPY_BATCH_SIZE:
+        return [
+            pow(int(subject), int(loop_size), TRANSFORM_INTEGER)
+            for loop_size, subject in zip(loop_sizes, subjects)
+        ]
+    try:
+        import numpy as np
+    except ImportError:
+        return [
+            pow(int(subject), int(loop_size), TRANSFORM_INTEGER)
+            for loop_size, subject in zip(loop_sizes, subjects)
+        ]
+    exponents = np.asarray(loop_sizes, dtype=np.uint64)
+    # reduce before converting so big or negative subjects fit in a uint64...
+    base = np.fromiter(
+        (int(subject) % TRANSFORM_INTEGER for subject in subjects),
+        dtype=np.uint64,
+        count=len(exponents))
+    result = np.ones_like(exponents)
+    one = np.uint64(1)
+    for _ in range(int(exponents.max()).bit_length()):
+        # multiply in the base wherever the lowest bit is set...
+        result *= np.where(exponents & one, base, one)
+        result %= TRANSFORM_INTEGER
+        base *= base
+        base %= TRANSFORM_INTEGER
+        exponents >>= one
+    return result.tolist()
+
+
 def discrete_logarithm(a, b, m):
     """
     Find k such that a^k cong b (mod m)
@@ -60,9 +125,258 @@ def discrete_logarithm(a, b, m):
     raise ValueError("No solution")
 
 
-def inverse_transform(value: int):
+def baby_step_giant_step(a, b, m):
+    """
+    Find k such that a^k cong b (mod m)
+    via the baby step giant step algorithm
+
+    This is the same as `discrete_logarithm` but the giant steps are kept in a
+    dict so only about sqrt(m) of them are stored rather than a table of m.
+    """
+    n = int(math.sqrt(m) + 1)
+
+    # Store all values of a^(n*i) of LHS, keeping the first i for each...
+    an = pow(a, n, m)
+    giant_steps = {}
+    cur = an
+    for i in range(1, n + 1):
+        giant_steps.setdefault(cur, i)
+        cur = (cur * an) % m
+
+    return _walk_baby_steps(a, b, m, n, giant_steps.get)
+
+
+def _walk_baby_steps(a, b, m, n, lookup):
+    """Walk the baby steps (a ^ j) * b until one collides with a giant step.
+    The lookup gives the giant step i for a value, or None."""
+    cur = b
+    for j in range(n + 1):
+        # Calculate (a ^ j) * b and check for collision
+        i = lookup(cur)
+        if i is not None:
+            ans = i * n - j
+            if ans < m:
+                return ans
+        cur = (cur * a) % m
+
+    raise ValueError("No solution")
+
+
+def _step_size(modulus):
+    """The number of baby steps per giant step for the modulus"""
+    return int(math.sqrt(modulus) + 1)
+
+
+class GiantStepTable:
+    """The giant steps a^(n*i) for a fixed subject and modulus, sorted by value
+    so that they can be searched without a dict.
+
+    The table can be written to a file and loaded back memory mapped so that it
+    costs nothing to load and can be shared by many processes.
+    """
+
+    def __init__(self, subject, modulus, n, values, steps):
+        self.subject = subject
+        self.modulus = modulus
+        self.n = n
+        self._values = values
+        self._steps = steps
+
+    def __len__(self):
+        return len(self._values)
+
+    @classmethod
+    def build(cls, subject, modulus):
+        n = _step_size(modulus)
+        an = pow(subject, n, modulus)
+        giant_steps = {}
+        cur = an
+        for i in range(1, n + 1):
+            giant_steps.setdefault(cur, i)
+            cur = (cur * an) % modulus
+        ordered = sorted(giant_steps.items())
+        return cls(
+            subject,
+            modulus,
+            n,
+            array('Q', (value for value, _ in ordered)),
+            array('Q', (step for _, step in ordered)))
+
+    @classmethod
+    def load(cls, filename):
+        """Load the table from a file by memory mapping it"""
+        with open(filename, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, subject, modulus, n, length = _TABLE_HEADER.unpack_from(buffer)
+        if magic != _TABLE_MAGIC:
+            raise ValueError(f"'{filename}' is not a giant step table")
+        # a truncated or padded file can't be trusted...
+        if len(buffer) != _TABLE_HEADER.size + 16 * length or length > n:
+            raise ValueError(f"'{filename}' is corrupt")
+        tables = memoryview(buffer)[_TABLE_HEADER.size:].cast('Q')
+        return cls(
+            subject, modulus, n, tables[:length], tables[length:2 * length])
+
+    def write(self, filename):
+        """Write the table to a file. It is written alongside and renamed into
+        place so that other processes never see a partial table."""
+        partial = f"{filename}.{os.getpid()}.partial"
+        with open(partial, 'wb') as file:
+            file.write(_TABLE_HEADER.pack(
+                _TABLE_MAGIC, self.subject, self.modulus, self.n, len(self)))
+            file.write(self._values.tobytes())
+            file.write(self._steps.tobytes())
+        os.replace(partial, filename)
+
+    def lookup(self, value):
+        """Get the giant step i for the value, or None if there isn't one"""
+        index = bisect.bisect_left(self._values, value)
+        if index < len(self._values) and self._values[index] == value:
+            return self._steps[index]
+        return None
+
+    def discrete_logarithm(self, b):
+        """Find k such that subject^k cong b (mod modulus)"""
+        return _walk_baby_steps(
+            self.subject, b, self.modulus, self.n, self.lookup)
+
+
+_giant_step_tables = {}
+
+
+def get_giant_step_table(
+        subject=SUBJECT_INTEGER,
+        modulus=TRANSFORM_INTEGER,
+        cache_dir=None):
+    """Get the giant step table for the subject and modulus.
+
+    Tables are remembered for the life of the process and cached on disk in the
+    cache directory (`CACHE_DIR` by default) so they are only ever built once.
+    A cached table for other parameters is never used since the file is named
+    after them and its header is checked too.
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    key = (subject, modulus)
+    if key in _giant_step_tables:
+        return _giant_step_tables[key]
+    filename = os.path.join(cache_dir, f"giant-steps-{subject}-{modulus}.bin")
+    table = None
+    try:
+        table = GiantStepTable.load(filename)
+        if (table.subject, table.modulus) != key \
+                or table.n != _step_size(modulus):
+            table = None
+    except (OSError, ValueError, struct.error):
+        pass
+    if table is None:
+        table = GiantStepTable.build(subject, modulus)
+        os.makedirs(cache_dir, exist_ok=True)
+        table.write(filename)
+    _giant_step_tables[key] = table
+    return table
+
+
+@functools.lru_cache()
+def factorise(n):
+    """Get the prime factors of n and their exponents by trial division"""
+    factors = {}
+    p = 2
+    while p * p <= n:
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+        p += 1 if p == 2 else 2
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def multiplicative_order(a, m, factors):
+    """Get the order of a (mod m) given the factors of the group order m-1"""
+    order = m - 1
+    for p in factors:
+        while order % p == 0 and pow(a, order // p, m) == 1:
+            order //= p
+    return order
+
+
+def _bounded_discrete_logarithm(a, b, m, order):
+    """
+    Find k < order such that a^k cong b (mod m) where a has the given order,
+    via the baby step giant step algorithm over the subgroup only
+    """
+    n = math.isqrt(order) + 1
+    baby_steps = {}
+    cur = 1
+    for j in range(n):
+        baby_steps.setdefault(cur, j)
+        cur = (cur * a) % m
+    giant_step = pow(a, -n, m)
+    cur = b
+    for i in range(n + 1):
+        j = baby_steps.get(cur)
+        if j is not None:
+            return i * n + j
+        cur = (cur * giant_step) % m
+    raise ValueError("No solution")
+
+
+def chinese_remainder(residues, moduli):
+    """Find x such that x cong r (mod n) for each residue r and modulus n. The
+    moduli must be coprime."""
+    product = math.prod(moduli)
+    x = 0
+    for residue, modulus in zip(residues, moduli):
+        partial = product // modulus
+        x += residue * partial * pow(partial, -1, modulus)
+    return x % product
+
+
+def pohlig_hellman(a, b, m):
+    """
+    Find k such that a^k cong b (mod m) for a prime m
+    via the Pohlig-Hellman algorithm
+
+    The logarithm is found modulo each prime power factor of the order of a
+    one digit at a time, then the results are combined with the chinese
+    remainder theorem. This is fast when m-1 only has small prime factors.
+    Like the other engines, k is in the range [1, order] so b = 1 gives the
+    order itself rather than 0.
+    """
+    factors = factorise(m - 1)
+    order = multiplicative_order(a, m, factors)
+    residues = []
+    moduli = []
+    for p in factors:
+        # the largest power of p that divides the order...
+        e = 0
+        while order % p ** (e + 1) == 0:
+            e += 1
+        if not e:
+            continue
+        # gamma generates the subgroup of order p...
+        gamma = pow(a, order // p, m)
+        x = 0
+        for k in range(e):
+            h = pow(pow(a, -x, m) * b, order // p ** (k + 1), m)
+            x += _bounded_discrete_logarithm(gamma, h, m, p) * p ** k
+        residues.append(x)
+        moduli.append(p ** e)
+    # the other engines count from 1 so a whole cycle stands in for 0...
+    k = chinese_remainder(residues, moduli) or order
+    if pow(a, k, m) != b % m:
+        raise ValueError("No solution")
+    return k
+
+
+def inverse_transform_bsgs(value: int):
+    """Get the loop size from the result of a transform"""
+    return get_giant_step_table().discrete_logarithm(value)
+
+
+def inverse_transform_pohlig_hellman(value: int):
     """Get the loop size from the result of a transform"""
-    return discrete_logarithm(SUBJECT_INTEGER, value, TRANSFORM_INTEGER)
+    return pohlig_hellman(SUBJECT_INTEGER, value, TRANSFORM_INTEGER)
 
 
 def inverse_transform_brute_force(value: int):
@@ -74,6 +388,21 @@ def inverse_transform_brute_force(value: int):
     return i
 
 
+ENGINES = {
+    "bsgs": inverse_transform_bsgs,
+    "pohlig-hellman": inverse_transform_pohlig_hellman,
+    "brute-force": inverse_transform_brute_force,
+}
+# the factors of TRANSFORM_INTEGER - 1 are all small so this is the fastest...
+DEFAULT_ENGINE = "pohlig-hellman"
+
+
+def inverse_transform(value: int, engine: str=DEFAULT_ENGINE):
+    """Get the loop size from the result of a transform using one of the
+    `ENGINES`"""
+    return ENGINES[engine](value)
+
+
 def get_solution(filename):
     # 1. get the keys from the input...
     card_key, door_key = read_keys(filename)
@@ -89,13 +418,73 @@ def get_solution(filename):
     return encryption_key1
 
 
-# Tests against example input in the description...
-assert CARD_PUBLIC_KEY == transform(CARD_LOOP_SIZE)
-assert CARD_LOOP_SIZE == inverse_transform(CARD_PUBLIC_KEY)
-assert DOOR_PUBLIC_KEY == transform(DOOR_LOOP_SIZE)
-assert DOOR_LOOP_SIZE == inverse_transform(DOOR_PUBLIC_KEY)
-assert ENCRYPTION_KEY == transform(DOOR_LOOP_SIZE, CARD_PUBLIC_KEY)
-assert ENCRYPTION_KEY == transform(CARD_LOOP_SIZE, DOOR_PUBLIC_KEY)
+def read_key_pairs(filename):
+    """Get the (card, door) public keys from a file with one pair per line"""
+    with open(filename, 'r') as file:
+        for line in file:
+            fields = line.split()
+            if fields:
+                card_key, door_key = fields
+                yield int(card_key), int(door_key)
+
+
+def crack(key_pair, engine=DEFAULT_ENGINE):
+    """Get the encryption key for a (card, door) pair of public keys. Only the
+    card's loop size is needed to derive the key."""
+    card_key, door_key = key_pair
+    return transform(inverse_transform(card_key, engine), door_key)
+
+
+def _init_cracker(engine, cache_dir):
+    if engine == "bsgs":
+        # the table is already cached on disk so each worker maps the same
+        # file read only and the pages are shared between them...
+        get_giant_step_table(cache_dir=cache_dir)
+
+
+def crack_many(
+        key_pairs,
+        workers=None,
+        engine=DEFAULT_ENGINE,
+        chunksize=1024,
+        cache_dir=None):
+    """Get the encryption key for each (card, door) pair of public keys using
+    a pool of processes. The keys are yielded in the same order as the pairs
+    as soon as they are ready so that any number of pairs can be streamed."""
+    # workers that don't fork won't see changes to CACHE_DIR so pass it on...
+    cache_dir = cache_dir or CACHE_DIR
+    if engine == "bsgs":
+        # build and cache the table once before any workers start...
+        get_giant_step_table(cache_dir=cache_dir)
+    with multiprocessing.Pool(
+            workers,
+            initializer=_init_cracker,
+            initargs=(engine, cache_dir)) as pool:
+        yield from pool.imap(
+            functools.partial(crack, engine=engine), key_pairs, chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Day 25: Combo Breaker")
+    parser.add_argument(
+        "filename",
+        nargs="?",
+        default=PUZZLE_INPUT,
+        help="file with the card and door public keys on separate lines")
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="the file has one (card, door) pair per line to crack in bulk")
+    parser.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+    if args.bulk:
+        pairs = read_key_pairs(args.filename)
+        for key in crack_many(pairs, args.workers, args.engine):
+            print(key)
+    else:
+        print(get_solution(args.filename))
+
 
-# print the solution to the problem...
-print(get_solution("puzzle-input.txt"))
\ No newline at end of file
+if __name__ == "__main__":
+    main()
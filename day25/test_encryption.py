@@ -0,0 +1,159 @@
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import encryption
+from encryption import (
+    CARD_LOOP_SIZE,
+    CARD_PUBLIC_KEY,
+    DOOR_LOOP_SIZE,
+    DOOR_PUBLIC_KEY,
+    ENCRYPTION_KEY,
+    SUBJECT_INTEGER,
+    TRANSFORM_INTEGER,
+)
+
+# Tests against example input in the description...
+class EncryptionTestGroup(unittest.TestCase):
+
+    def setUp(self):
+        # keep any cached tables out of the real cache...
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = unittest.mock.patch.object(
+            encryption, "CACHE_DIR", directory.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(encryption._giant_step_tables.clear)
+
+    def test_transform_gives_public_keys(self):
+        self.assertEqual(CARD_PUBLIC_KEY, encryption.transform(CARD_LOOP_SIZE))
+        self.assertEqual(
+            CARD_PUBLIC_KEY, encryption.transform_loop(CARD_LOOP_SIZE))
+        self.assertEqual(DOOR_PUBLIC_KEY, encryption.transform(DOOR_LOOP_SIZE))
+
+    def test_transform_gives_encryption_key(self):
+        self.assertEqual(
+            ENCRYPTION_KEY,
+            encryption.transform(DOOR_LOOP_SIZE, CARD_PUBLIC_KEY))
+        self.assertEqual(
+            ENCRYPTION_KEY,
+            encryption.transform(CARD_LOOP_SIZE, DOOR_PUBLIC_KEY))
+
+    def test_transform_many_matches_transform(self):
+        self.assertEqual(
+            [CARD_PUBLIC_KEY, ENCRYPTION_KEY],
+            encryption.transform_many(
+                [CARD_LOOP_SIZE, DOOR_LOOP_SIZE], [7, CARD_PUBLIC_KEY]))
+        n = encryption.NUMPY_BATCH_SIZE
+        self.assertEqual(
+            [encryption.transform(i, i + 2) for i in range(n)],
+            encryption.transform_many(range(n), range(2, n + 2)))
+
+    def test_transform_many_reduces_any_subject(self):
+        for n in [3, encryption.NUMPY_BATCH_SIZE]:
+            for subject in [2 ** 70, -7]:
+                self.assertEqual(
+                    [pow(subject, 5, TRANSFORM_INTEGER)] * n,
+                    encryption.transform_many([5] * n, subject),
+                    msg=f"{n} x {subject}")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_transform_many_takes_numpy_subject(self):
+        self.assertEqual(
+            [encryption.transform(5, 7), encryption.transform(6, 7)],
+            encryption.transform_many([5, 6], numpy.int64(7)))
+
+    def test_inverse_transform_gives_loop_sizes(self):
+        self.assertEqual(
+            CARD_LOOP_SIZE, encryption.inverse_transform(CARD_PUBLIC_KEY))
+        self.assertEqual(
+            DOOR_LOOP_SIZE, encryption.inverse_transform(DOOR_PUBLIC_KEY))
+
+    def test_baby_step_giant_step_matches_reference(self):
+        self.assertEqual(
+            encryption.discrete_logarithm(
+                SUBJECT_INTEGER, DOOR_PUBLIC_KEY, TRANSFORM_INTEGER),
+            encryption.baby_step_giant_step(
+                SUBJECT_INTEGER, DOOR_PUBLIC_KEY, TRANSFORM_INTEGER))
+
+    def test_giant_step_table_is_reloaded_from_cache(self):
+        table = encryption.get_giant_step_table(5, 1000003)
+        encryption._giant_step_tables.clear()
+        cached = encryption.get_giant_step_table(5, 1000003)
+        self.assertIsNot(table, cached)
+        self.assertEqual(len(table), len(cached))
+        self.assertEqual(
+            12345, cached.discrete_logarithm(pow(5, 12345, 1000003)))
+
+    def test_every_engine_inverts_public_keys(self):
+        for engine in encryption.ENGINES:
+            self.assertEqual(
+                CARD_LOOP_SIZE,
+                encryption.inverse_transform(CARD_PUBLIC_KEY, engine),
+                msg=engine)
+            self.assertEqual(
+                DOOR_LOOP_SIZE,
+                encryption.inverse_transform(DOOR_PUBLIC_KEY, engine),
+                msg=engine)
+            if engine == "brute-force":
+                # ...would have to walk all the way round the group
+                continue
+            self.assertEqual(
+                TRANSFORM_INTEGER - 1,
+                encryption.inverse_transform(1, engine),
+                msg=engine)
+
+    def test_truncated_giant_step_table_is_rebuilt(self):
+        table = encryption.get_giant_step_table(5, 1000003)
+        filename = os.path.join(
+            encryption.CACHE_DIR, "giant-steps-5-1000003.bin")
+        size = os.path.getsize(filename)
+        # cut short both mid value and on a value boundary...
+        for length in [size - 3, size - 8 * 100]:
+            encryption._giant_step_tables.clear()
+            os.truncate(filename, length)
+            cached = encryption.get_giant_step_table(5, 1000003)
+            self.assertEqual(len(table), len(cached))
+            self.assertEqual(
+                12345, cached.discrete_logarithm(pow(5, 12345, 1000003)))
+            self.assertEqual(size, os.path.getsize(filename))
+
+    def test_pohlig_hellman_for_other_moduli(self):
+        self.assertEqual(
+            12345, encryption.pohlig_hellman(5, pow(5, 12345, 1000003), 1000003))
+
+    def test_crack_many_keeps_order(self):
+        pairs = [
+            (CARD_PUBLIC_KEY, DOOR_PUBLIC_KEY),
+            (DOOR_PUBLIC_KEY, CARD_PUBLIC_KEY),
+            (encryption.transform(1234), encryption.transform(99)),
+        ]
+        self.assertEqual(
+            [ENCRYPTION_KEY, ENCRYPTION_KEY, encryption.transform(1234 * 99)],
+            list(encryption.crack_many(pairs, workers=2)))
+
+    def test_crack_many_shares_cached_table(self):
+        pairs = [
+            (encryption.transform(i), encryption.transform(i + 7))
+            for i in range(1, 50)
+        ]
+        encryption.get_giant_step_table()
+        filename = os.path.join(
+            encryption.CACHE_DIR,
+            f"giant-steps-{SUBJECT_INTEGER}-{TRANSFORM_INTEGER}.bin")
+        cached = os.stat(filename)
+        # start the workers without the table this process already has...
+        encryption._giant_step_tables.clear()
+        self.assertEqual(
+            [encryption.transform(i * (i + 7)) for i in range(1, 50)],
+            list(encryption.crack_many(
+                pairs, workers=2, engine="bsgs", chunksize=4)))
+        # the workers mapped the cached file rather than writing another...
+        self.assertEqual(cached.st_ino, os.stat(filename).st_ino)
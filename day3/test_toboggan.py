@@ -5,20 +5,14 @@ from toboggan import (
     get_route,
     get_solution,
     load_forest,
+    PART1_SLOPE,
+    PART2_SLOPES,
+    REAL_INPUT,
     Slope,
 )
 
 HERE, _ = path.split(path.realpath(__file__))
 EXAMPLE_INPUT = path.join(HERE, "input-example.txt")
-REAL_INPUT = path.join(HERE, "input-day3.txt")
-PART1_SLOPE = Slope(1, 3)
-PART2_SLOPES = [
-    Slope(1, 1),
-    PART1_SLOPE,
-    Slope(1, 5),
-    Slope(1, 7),
-    Slope(2, 1),
-]
 
 #### PART1
 assert ''.join(get_route(load_forest(EXAMPLE_INPUT), PART1_SLOPE)) \
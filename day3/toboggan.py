@@ -1,8 +1,20 @@
 import collections
 from os import path
+import sys
 
 Slope = collections.namedtuple("Slope", ["down", "right"])
 
+HERE, _ = path.split(path.realpath(__file__))
+REAL_INPUT = path.join(HERE, "input-day3.txt")
+PART1_SLOPE = Slope(1, 3)
+PART2_SLOPES = [
+    Slope(1, 1),
+    PART1_SLOPE,
+    Slope(1, 5),
+    Slope(1, 7),
+    Slope(2, 1),
+]
+
 def load_forest(filename):
     """Get the forest row-by-row as a strings. # = tree, . = space"""
     with open(filename, 'r') as file:
@@ -34,3 +46,14 @@ def get_solution(filename, slopes):
     for result in results:
         solution *= result
     return solution
+
+def main(argv=None):
+    filename = argv[0] if argv else REAL_INPUT
+    print(
+        "PART1 result -> "
+        f"{count_trees(get_route(load_forest(filename), PART1_SLOPE))}"
+    )
+    print(f"PART2 result -> {get_solution(filename, PART2_SLOPES)}")
+
+if __name__ == '__main__':
+    main(sys.argv[1:])